@@ -0,0 +1,25 @@
+import importlib
+
+# public classes, imported from their submodules on first access
+_LAZY = {
+    "Dataset": "gsemantique.data.datasets",
+    "DatasetCatalog": "gsemantique.data.datasets",
+    "Downloader": "gsemantique.data.download",
+    "Finder": "gsemantique.data.search",
+    "TileHandler": "gsemantique.process.scaling",
+    "TileHandlerParallel": "gsemantique.process.scaling",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY])
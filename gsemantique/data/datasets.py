@@ -1,18 +1,110 @@
-import copy
+import functools
+import gzip
 import json
-import numpy as np
+import logging
 import os
-import pandas as pd
-import planetary_computer as pc
 import pickle
-from pystac_client import Client
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 FILE_PATH = os.path.dirname(os.path.abspath(__file__))
+logger = logging.getLogger(__name__)
+
+# opened STAC clients, shared across datasets of the same endpoint
+_CLIENT_CACHE = {}
+
+# inferred (spatial, temporal) extents per (endpoint, collection)
+_EXTENT_CACHE = {}
+
+# format version of the pickled catalog cache
+CACHE_VERSION = 1
+
+# format version of the pickled layout sidecar (see Dataset._load_flat_layout),
+# to be increased whenever the parsed/flattened layout changes
+LAYOUT_CACHE_VERSION = 1
+
+
+def _get_client(endpoint):
+    """
+    Returns a (cached) STAC client for the given endpoint. Items retrieved
+    via this client are not signed, i.e. it's meant for collection metadata.
+    """
+    # imported lazily, not needed for catalogs loaded from cache
+    from pystac_client import Client
+    from pystac_client.stac_api_io import StacApiIO
+    from urllib3 import Retry
+
+    client = _CLIENT_CACHE.get(endpoint)
+    if client is None:
+        # few quick retries, metadata requests shouldn't block for long
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[408, 502, 503, 504],
+            allowed_methods=None,
+        )
+        client = Client.open(
+            endpoint,
+            stac_io=StacApiIO(max_retries=retry, timeout=60),
+        )
+        _CLIENT_CACHE[endpoint] = client
+    return client
+
+
+@functools.lru_cache(maxsize=4)
+def _load_layout(file):
+    """
+    Returns the parsed & flattened layout of the given layout file.
+    Loaded once per file and process, shared across all datasets.
+    """
+    return Dataset._load_flat_layout(file)
 
 
 class Dataset:
     """A STAC-compliant dataset/collection including provider information."""
 
+    __slots__ = (
+        "provider",
+        "endpoint",
+        "collection",
+        "category",
+        "temporality",
+        "_temporal_extent",
+        "_spatial_extent",
+        "src",
+        "info",
+        "copyright",
+        "layout_keys",
+        "layout_bands",
+        "_attrs",
+        "_extent_fetch_failed",
+    )
+
+    # data attributes exposed in the catalog representations
+    _CATALOG_FIELDS = (
+        "provider",
+        "endpoint",
+        "collection",
+        "category",
+        "temporality",
+        "temporal_extent",
+        "spatial_extent",
+        "src",
+        "info",
+        "copyright",
+        "layout_keys",
+        "layout_bands",
+    )
+
+    # low-cardinality string attributes shared by many datasets
+    _INTERNED_FIELDS = (
+        "provider",
+        "endpoint",
+        "category",
+        "temporality",
+        "copyright",
+    )
+
     def __init__(
         self,
         provider,
@@ -42,22 +134,67 @@ class Dataset:
         Note: temporality should be given in offset units as defined here
         (https://pandas.pydata.org/docs/user_guide/timeseries.html#dateoffset-objects)
         """
+        # catalog attributes, kept in sync by __setattr__
+        self._attrs = {}
+        self._extent_fetch_failed = False
         self.provider = provider
         self.endpoint = endpoint
         self.collection = collection
         self.category = category
         self.temporality = temporality
-        self.temporal_extent = temporal_extent
-        self.spatial_extent = spatial_extent
         self.src = src
         self.info = info
         self.copyright = copyright
-        # get extents if not provided
-        self._auto_infer_extents()
+        # extents not provided are inferred lazily on first access
+        self.temporal_extent = temporal_extent
+        self.spatial_extent = spatial_extent
         # init empty attributes for layout
         self.layout_keys = []
         self.layout_bands = {}
 
+    def __setattr__(self, name, value):
+        if name in Dataset._INTERNED_FIELDS and isinstance(value, str):
+            value = sys.intern(value)
+        super().__setattr__(name, value)
+        if name in Dataset._CATALOG_FIELDS:
+            self._attrs[name] = value
+            if name == "layout_keys":
+                self._attrs["n_bands"] = len(value)
+
+    def __getstate__(self):
+        # pickle extents under their public names (resolving them if needed)
+        return {k: getattr(self, k) for k in Dataset._CATALOG_FIELDS}
+
+    def __setstate__(self, state):
+        self._attrs = {}
+        self._extent_fetch_failed = False
+        self.spatial_extent = None
+        self.temporal_extent = None
+        for k, v in state.items():
+            setattr(self, k, v)
+
+    @property
+    def spatial_extent(self):
+        """Spatial coverage, inferred from the STAC collection if not provided."""
+        if self._spatial_extent is None:
+            self._auto_infer_extents()
+        return self._spatial_extent
+
+    @spatial_extent.setter
+    def spatial_extent(self, value):
+        self._spatial_extent = value
+
+    @property
+    def temporal_extent(self):
+        """Temporal coverage, inferred from the STAC collection if not provided."""
+        if self._temporal_extent is None:
+            self._auto_infer_extents()
+        return self._temporal_extent
+
+    @temporal_extent.setter
+    def temporal_extent(self, value):
+        self._temporal_extent = value
+
     def add_layout_info(
         self,
         keys,
@@ -68,65 +205,127 @@ class Dataset:
         i.e. the band keys & their attributes
         """
         self.layout_keys = keys
-        with open(file, "r") as f:
-            layout_json = json.load(f)
-            parsed_layout = Dataset._parse_layout(layout_json)
-            for k in self.layout_keys:
-                self.layout_bands[k[-1]] = Dataset._lookup(parsed_layout, *k)
+        flat_layout = _load_layout(file)
+        for k in self.layout_keys:
+            self.layout_bands[k[-1]] = flat_layout[tuple(k)]
 
     def _auto_infer_extents(self):
         """
         Automatically infers the spatial and temporal extents of the dataset
         from the STAC collection if they are not provided.
         """
-        if self.spatial_extent is None or self.temporal_extent is None:
+        if self._extent_fetch_failed:
+            return
+        if self._spatial_extent is not None and self._temporal_extent is not None:
+            return
+        key = (self.endpoint, self.collection)
+        extents = _EXTENT_CACHE.get(key)
+        if extents is None:
             try:
                 # get collection metadata
-                if self.provider == "Planet":
-                    catalog = Client.open(self.endpoint, modifier=pc.sign_inplace)
-                else:
-                    catalog = Client.open(self.endpoint)
+                catalog = _get_client(self.endpoint)
                 collection = catalog.get_child(self.collection)
                 # parse spatial and temporal extents
-                if self.spatial_extent is None:
-                    spatial_extent = collection.extent.spatial.bboxes
-                    self.spatial_extent = np.round(spatial_extent).tolist()[0]
-                if self.temporal_extent is None:
-                    self.temporal_extent = collection.extent.temporal.intervals[0]
+                bbox = collection.extent.spatial.bboxes[0]
+                extents = (
+                    [round(v) for v in bbox],
+                    collection.extent.temporal.intervals[0],
+                )
             except Exception as e:
-                print(f"Failed to auto-infer extents: {e}")
+                # don't retry on every access of the extents
+                self._extent_fetch_failed = True
+                logger.warning(
+                    f"Failed to auto-infer extents of {self.collection}: {e}"
+                )
+                return
+            _EXTENT_CACHE[key] = extents
+        if self._spatial_extent is None:
+            self.spatial_extent = extents[0]
+        if self._temporal_extent is None:
+            self.temporal_extent = extents[1]
+
+    @staticmethod
+    def _load_flat_layout(file):
+        """
+        Loads the flattened layout from its pickled sidecar file (<file>.pkl)
+        if it's up-to-date, otherwise parses the layout file and updates the sidecar
+        """
+        cache_file = file + ".pkl"
+        try:
+            if os.path.getmtime(cache_file) >= os.path.getmtime(file):
+                with open(cache_file, "rb") as f:
+                    cache = pickle.load(f)
+                # sidecars of other formats are re-created
+                if (
+                    isinstance(cache, dict)
+                    and cache.get("version") == LAYOUT_CACHE_VERSION
+                ):
+                    return cache["layout"]
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        with open(file, "r") as f:
+            parsed_layout = Dataset._parse_layout(json.load(f))
+        flat_layout = Dataset._flatten_layout(parsed_layout)
+        try:
+            # write to a temporary file first, so that concurrent processes
+            # never read a partially written sidecar
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "wb") as f:
+                pickle.dump(
+                    {"version": LAYOUT_CACHE_VERSION, "layout": flat_layout},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            # e.g. read-only installations, simply don't persist the layout
+            pass
+        return flat_layout
 
     @staticmethod
     def _parse_layout(obj):
         """
-        Function to recursively parse and metadata objects from layout.json
+        Function to parse the metadata objects from layout.json
         and to make them autocomplete friendly
         """
-
-        def _parse(current_obj, ref_path):
+        # traverse the object iteratively, starting from the root object
+        stack = [(v, (k,)) for k, v in obj.items() if isinstance(v, dict)]
+        while stack:
+            current_obj, ref_path = stack.pop()
             if "type" in current_obj and "values" in current_obj:
-                current_obj["reference"] = copy.deepcopy(ref_path)
+                current_obj["reference"] = ref_path
                 if isinstance(current_obj["values"], list):
-                    current_obj["labels"] = {
-                        item["label"]: item["id"] for item in current_obj["values"]
-                    }
-                    current_obj["descriptions"] = {
-                        item["description"]: item["id"]
-                        for item in current_obj["values"]
-                    }
-                return
-            # If not a "layer", traverse deeper into the object.
-            for key, value in current_obj.items():
-                if isinstance(value, dict):
-                    new_ref_path = ref_path + [key]
-                    _parse(value, new_ref_path)
-
-        # Start parsing from the root object.
-        for key, value in obj.items():
-            if isinstance(value, dict):
-                _parse(value, [key])
+                    labels, descriptions = {}, {}
+                    for item in current_obj["values"]:
+                        labels[item["label"]] = item["id"]
+                        descriptions[item["description"]] = item["id"]
+                    current_obj["labels"] = labels
+                    current_obj["descriptions"] = descriptions
+            else:
+                # if not a "layer", traverse deeper into the object
+                stack.extend(
+                    (v, ref_path + (k,))
+                    for k, v in current_obj.items()
+                    if isinstance(v, dict)
+                )
         return obj
 
+    @staticmethod
+    def _flatten_layout(obj):
+        """
+        Maps the references of all data layers in a parsed layout
+        to their metadata objects
+        """
+        flat_layout = {}
+        stack = [v for v in obj.values() if isinstance(v, dict)]
+        while stack:
+            current_obj = stack.pop()
+            if "type" in current_obj and "values" in current_obj:
+                flat_layout[current_obj["reference"]] = current_obj
+            else:
+                stack.extend(v for v in current_obj.values() if isinstance(v, dict))
+        return flat_layout
+
     @staticmethod
     def _lookup(obj, *reference):
         """Lookup the metadata of a referenced data layer.
@@ -156,10 +355,9 @@ class DatasetCatalog:
 
     def __str__(self):
         if self.datasets:
-            catalog_df = self.parse_as_table(keys=None)
-            n_prov = len(catalog_df["provider"].unique())
+            n_prov = len({ds.provider for ds in self.datasets})
             n_ds = len(self.datasets)
-            n_lyr = sum(catalog_df["n_bands"])
+            n_lyr = sum(len(ds.layout_keys) for ds in self.datasets)
             catalog_info = "DatasetCatalog containing\n"
             prov_info = f"- {n_prov} providers (catalogs)\n"
             ds_info = f"- {n_ds} datasets (collections)\n"
@@ -174,23 +372,26 @@ class DatasetCatalog:
     def __init__(self, cache_path=os.path.join(FILE_PATH, "data_cache.pkl")):
         self.cache_path = cache_path
         self.datasets = []
+        # tables of the catalog, keyed by (catalog version, keys)
+        self._version = 0
+        self._table_cache = {}
 
     def add(self, dataset):
         """Adds a new dataset as an instance `Dataset` of to the catalog."""
         self.datasets.append(dataset)
+        self._modified()
 
     def filter(self, **criteria):
         """Filters catalog according to dataset attributes."""
-        df = self.parse_as_table(keys=None)
-        for attr, value in criteria.items():
-            if value is not None:
-                if isinstance(value, list):
-                    df = df[df[attr].isin(value)]
-                else:
-                    df = df[df[attr] == value]
-            else:
-                df = df[df[attr].isna()]
-        return df
+        idxs = self._filter_idxs(criteria)
+        return self._create_table([self.datasets[i] for i in idxs], index=idxs)
+
+    def filter_datasets(self, **criteria):
+        """
+        Filters catalog according to dataset attributes, returning the
+        matching `Dataset` instances instead of a DataFrame.
+        """
+        return [self.datasets[i] for i in self._filter_idxs(criteria)]
 
     def load(self, from_cache=True, cache_path=None):
         """
@@ -202,8 +403,18 @@ class DatasetCatalog:
             cache_path = self.cache_path
         if from_cache:
             if os.path.exists(cache_path):
-                with open(cache_path, "rb") as f:
-                    self.datasets = pickle.load(f)
+                with DatasetCatalog._open_cache(cache_path, "rb") as f:
+                    cache = pickle.load(f)
+                # unversioned caches are plain lists of datasets
+                if isinstance(cache, dict):
+                    if cache["version"] > CACHE_VERSION:
+                        raise ValueError(
+                            f"{cache_path} was created by a newer version "
+                            f"(cache version {cache['version']})."
+                        )
+                    cache = cache["datasets"]
+                self.datasets = cache
+                self._modified()
             else:
                 raise ValueError(f"{cache_path} does not exist.")
         else:
@@ -216,363 +427,392 @@ class DatasetCatalog:
         """
         Creates and returns a DataFrame containing all datasets,
         with optional filtering of keys.
+
+        Note: Tables are cached until the catalog is modified via `.add()`,
+        `.load()` or `.refresh_extents()`. Don't modify them in place.
         """
-        data = []
-        for dataset in self.datasets:
-            # compile dataset attributes
-            dataset_attributes = {
-                attr: getattr(dataset, attr)
-                for attr in dir(dataset)
-                if not attr.startswith("__") and not callable(getattr(dataset, attr))
-            }
-            dataset_attributes.update({"n_bands": len(dataset.layout_keys)})
-            # filter dataset attributes
-            if keys:
-                dataset_attributes = {
-                    key: dataset_attributes.get(key, None) for key in keys
-                }
-            data.append(dataset_attributes)
-        df = pd.DataFrame(data)
+        cache_key = (self._version, tuple(keys) if keys else None)
+        df = self._table_cache.get(cache_key)
+        if df is None:
+            df = self._create_table(self.datasets, keys=keys)
+            self._table_cache[cache_key] = df
         return df
 
     def parse_as_dict(self, keys=None):
         """Creates and returns a dictionary representation of the catalog with optional filtering of keys."""
+        # provider and collection name are used as keys of the dictionary
+        fields = [
+            k
+            for k in (keys or Dataset._CATALOG_FIELDS)
+            if k not in ("provider", "collection", "n_bands")
+        ]
         catalog_dict = {}
         for dataset in self.datasets:
-            # Dynamically gather dataset attributes
-            dataset_attributes = {
-                attr: getattr(dataset, attr)
-                for attr in dir(dataset)
-                if not attr.startswith("__") and not callable(getattr(dataset, attr))
+            # resolve extents not inferred yet
+            dataset._auto_infer_extents()
+            attrs = dataset._attrs
+            provider_dict = catalog_dict.setdefault(
+                dataset.provider, {"endpoint": dataset.endpoint, "datasets": {}}
+            )
+            provider_dict["datasets"][dataset.collection] = {
+                k: attrs[k] for k in fields if k in attrs
             }
-            # Filter the attributes to include only those keys
-            if keys:
-                dataset_attributes = {
-                    key: dataset_attributes[key]
-                    for key in keys
-                    if key in dataset_attributes
-                }
-            # Use provider name and collection name as key
-            provider = dataset_attributes.pop("provider")
-            collection_name = dataset_attributes.pop("collection")
-            if provider not in catalog_dict:
-                catalog_dict[provider] = {
-                    "endpoint": dataset.endpoint,
-                    "datasets": {},
-                }
-            catalog_dict[provider]["datasets"][collection_name] = dataset_attributes
-
         return catalog_dict
 
     def save(self, cache_path=None):
         """
-        Saves the current data catalog as a pickled object.
+        Saves the current data catalog as a pickled object,
+        gzip-compressed if the cache path ends with ".gz".
         """
         if not cache_path:
             cache_path = self.cache_path
-        with open(cache_path, "wb") as f:
-            pickle.dump(self.datasets, f)
+        cache = {"version": CACHE_VERSION, "datasets": self.datasets}
+        with DatasetCatalog._open_cache(cache_path, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def refresh_extents(self):
+        """
+        Re-infers the spatial and temporal extents of all datasets from
+        their STAC collections, e.g. to update a catalog loaded from cache.
+        """
+        previous = []
+        for dataset in self.datasets:
+            previous.append((dataset._spatial_extent, dataset._temporal_extent))
+            _EXTENT_CACHE.pop((dataset.endpoint, dataset.collection), None)
+            dataset._extent_fetch_failed = False
+            dataset.spatial_extent = None
+            dataset.temporal_extent = None
+        self._resolve_extents()
+        # keep the previous extents of datasets that couldn't be refreshed
+        for dataset, (spatial_extent, temporal_extent) in zip(self.datasets, previous):
+            if dataset._spatial_extent is None:
+                dataset.spatial_extent = spatial_extent
+            if dataset._temporal_extent is None:
+                dataset.temporal_extent = temporal_extent
+        self._modified()
+
+    def _modified(self):
+        """Invalidates the cached tables after the catalog was modified."""
+        self._version += 1
+        self._table_cache.clear()
+
+    def _resolve_extents(self, max_workers=8):
+        """
+        Infers the missing extents of all datasets at once, opening each
+        STAC endpoint only once and fetching the collections concurrently.
+        """
+        pending = {}
+        for dataset in self.datasets:
+            if dataset._spatial_extent is None or dataset._temporal_extent is None:
+                pending.setdefault(dataset.endpoint, []).append(dataset)
+        # open clients upfront, datasets of unreachable endpoints are skipped
+        for endpoint, datasets in pending.items():
+            try:
+                _get_client(endpoint)
+            except Exception as e:
+                logger.warning(f"Failed to auto-infer extents from {endpoint}: {e}")
+                for dataset in datasets:
+                    dataset._extent_fetch_failed = True
+        datasets = [ds for dss in pending.values() for ds in dss]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(Dataset._auto_infer_extents, datasets))
+
+    def _filter_idxs(self, criteria):
+        """Returns the indices of the datasets matching all criteria."""
+
+        def _get(dataset, attr):
+            if attr == "n_bands":
+                return len(dataset.layout_keys)
+            return getattr(dataset, attr)
+
+        def _match(dataset):
+            for attr, value in criteria.items():
+                ds_value = _get(dataset, attr)
+                if value is None:
+                    if ds_value is not None:
+                        return False
+                elif isinstance(value, list):
+                    if ds_value not in value:
+                        return False
+                elif ds_value != value:
+                    return False
+            return True
+
+        return [i for i, ds in enumerate(self.datasets) if _match(ds)]
+
+    def _create_table(self, datasets, keys=None, index=None):
+        """Creates a DataFrame from the given datasets."""
+        # imported lazily, only needed for the tabular representation
+        import pandas as pd
+
+        # resolve extents not inferred yet
+        for dataset in datasets:
+            dataset._auto_infer_extents()
+        # compile dataset attributes column-wise
+        columns = list(keys) if keys else [*Dataset._CATALOG_FIELDS, "n_bands"]
+        data = {
+            key: [dataset._attrs.get(key) for dataset in datasets] for key in columns
+        }
+        # store low-cardinality columns as categoricals (only those without
+        # missing values, categoricals would turn None into a truthy NaN)
+        for key in ("provider", "category"):
+            if key in data and not pd.isna(data[key]).any():
+                data[key] = pd.Categorical(data[key])
+        return pd.DataFrame(data, index=index)
 
     def _load_defaults(self):
-        ds = Dataset(
-            provider="Planet",
-            endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
-            collection="sentinel-1-rtc",
-            category="SAR",
-            temporality="s",
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://planetarycomputer.microsoft.com/dataset/sentinel-1-rtc",
-            info="Sentinel-1 represent radar imaging (SAR) satellites launched in 2014 and 2016 with a 6 days revisit cycle. It's C-Band radar has the ability to penetrate clouds. The Sentinel-1 RTC data in this collection is a radiometrically terrain corrected product (gamma naught values) derived from the Ground Range Detected (GRD) Level-1 products produced by the European Space Agency. It accounts for terrain variations that affect both the position of a given point on the Earth's surface and the brightness of the radar return, as expressed in radar geometry. Without treatment, the hill-slope modulations of the radiometry threaten to overwhelm weaker thematic land cover-induced backscatter differences. Additionally, comparison of backscatter from multiple satellites, modes, or tracks loses meaning.",
-            copyright="CC BY 4.0",
-        )
-        ds.add_layout_info(
-            [
-                ("Planet", "reflectance", "s1_amp_vv"),
-                ("Planet", "reflectance", "s1_amp_vh"),
-                ("Planet", "reflectance", "s1_amp_hv"),
-                ("Planet", "reflectance", "s1_amp_hh"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="Planet",
-            endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
-            collection="sentinel-2-l2a",
-            category="multispectral",
-            temporality="s",
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://planetarycomputer.microsoft.com/dataset/sentinel-2-l2a",
-            info="The Sentinel-2 program provides global imagery in thirteen spectral bands at 10m-60m resolution and a revisit time of approximately five days. This dataset represents the global Sentinel-2 archive, from 2016 to the present, processed to L2A (bottom-of-atmosphere) using Sen2Cor and converted to cloud-optimized GeoTIFF format.",
-            copyright="Copernicus Sentinel Data Terms",
-        )
-        ds.add_layout_info(
-            [
-                ("Planet", "reflectance", "s2_band01"),
-                ("Planet", "reflectance", "s2_band02"),
-                ("Planet", "reflectance", "s2_band03"),
-                ("Planet", "reflectance", "s2_band04"),
-                ("Planet", "reflectance", "s2_band05"),
-                ("Planet", "reflectance", "s2_band06"),
-                ("Planet", "reflectance", "s2_band07"),
-                ("Planet", "reflectance", "s2_band08"),
-                ("Planet", "reflectance", "s2_band08A"),
-                ("Planet", "reflectance", "s2_band09"),
-                ("Planet", "reflectance", "s2_band11"),
-                ("Planet", "reflectance", "s2_band12"),
-                ("Planet", "classification", "scl"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="Planet",
-            endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
-            collection="landsat-c2-l2",
-            category="multispectral",
-            temporality="s",
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://planetarycomputer.microsoft.com/dataset/landsat-c2-l2",
-            info="Landsat Collection 2 Level-2 Science Products, consisting of atmospherically corrected surface reflectance and surface temperature image data. Collection 2 Level-2 Science Products are available from August 22, 1982 to present.This dataset represents the global archive acquired by the Thematic Mapper onboard Landsat 4 and 5, the Enhanced Thematic Mapper onboard Landsat 7, and the Operatational Land Imager and Thermal Infrared Sensor onboard Landsat 8 and 9.",
-            copyright="Public Domain (https://www.usgs.gov/emergency-operations-portal/data-policy)",
-        )
-        ds.add_layout_info(
-            [
-                ("Planet", "reflectance", "lndst_coastal"),
-                ("Planet", "reflectance", "lndst_blue"),
-                ("Planet", "reflectance", "lndst_green"),
-                ("Planet", "reflectance", "lndst_red"),
-                ("Planet", "reflectance", "lndst_nir08"),
-                ("Planet", "reflectance", "lndst_swir16"),
-                ("Planet", "reflectance", "lndst_swir22"),
-                ("Planet", "reflectance", "lndst_lwir109"),
-                ("Planet", "reflectance", "lndst_lwir114"),
-                ("Planet", "reflectance", "lndst_qa"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="Planet",
-            endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
-            collection="esa-worldcover",
-            category="landcover",
-            temporality="Y",
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://planetarycomputer.microsoft.com/dataset/esa-worldcover",
-            info="The European Space Agency (ESA) WorldCover product provides global land cover maps for the years 2020 and 2021 at 10 meter resolution based on the combination of Sentinel-1 radar data and Sentinel-2 imagery. The discrete classification maps provide 11 classes defined using the Land Cover Classification System (LCCS) developed by the United Nations (UN) Food and Agriculture Organization (FAO). The map images are stored in cloud-optimized GeoTIFF format. The WorldCover product is developed by a consortium of European service providers and research organizations. VITO (Belgium) is the prime contractor of the WorldCover consortium.",
-            copyright="Creative Commons Attribution 4.0 International License",
-        )
-        ds.add_layout_info(
-            [
-                ("Planet", "classification", "esa_lc"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="Planet",
-            endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
-            collection="io-lulc-annual-v02",
-            category="landcover",
-            temporality="Y",
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://planetarycomputer.microsoft.com/dataset/io-lulc-annual-v02",
-            info="Time series of annual global maps of land use and land cover (LULC). It currently has data from 2017-2023. The maps are derived from ESA Sentinel-2 imagery at 10m resolution. Each map is a composite of LULC predictions for 9 classes throughout the year in order to generate a representative snapshot of each year. This dataset is produced by Impact Observatory, Microsoft, and Esri. This dataset was generated by Impact Observatory, which used billions of human-labeled pixels (curated by the National Geographic Society) to train a deep learning model for land classification.",
-            copyright="Creative Commons BY-4.0",
-        )
-        ds.add_layout_info(
-            [
-                ("Planet", "classification", "impact_lc"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="Planet",
-            endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
-            collection="nasadem",
-            category="DEM",
-            temporality=None,
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://planetarycomputer.microsoft.com/dataset/nasadem",
-            info="NASADEM provides global topographic data at 1 arc-second (~30m) horizontal resolution, derived primarily from data captured via the Shuttle Radar Topography Mission (SRTM).",
-            copyright="Public Domain (https://lpdaac.usgs.gov/data/data-citation-and-policies/)",
-        )
-        ds.add_layout_info(
-            [
-                ("Planet", "topography", "dem"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="Planet",
-            endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
-            collection="cop-dem-glo-30",
-            category="DSM",
-            temporality=None,
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://planetarycomputer.microsoft.com/dataset/cop-dem-glo-30",
-            info="The Copernicus DEM is a digital surface model (DSM), which represents the surface of the Earth including buildings, infrastructure, and vegetation. This DSM is based on radar satellite data acquired during the TanDEM-X Mission, which was funded by a public-private partnership between the German Aerospace Centre (DLR) and Airbus Defence and Space. Copernicus DEM is available at both 30-meter and 90-meter resolution; this dataset has a horizontal resolution of approximately 30 meters.",
-            copyright=None,
-        )
-        ds.add_layout_info(
-            [
-                ("Planet", "topography", "dsm"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="Planet",
-            endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
-            collection="modis-64A1-061",
-            category="fire detection",
-            temporality="M",
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://planetarycomputer.microsoft.com/dataset/modis-64A1-061",
-            info="The Terra and Aqua combined MCD64A1 Version 6.1 Burned Area data product is a monthly, global gridded 500 m product containing per-pixel burned-area and quality information. The MCD64A1 burned-area mapping approach employs 500 m Moderate Resolution Imaging Spectroradiometer (MODIS) Surface Reflectance imagery coupled with 1 kilometer (km) MODIS active fire observations. The algorithm uses a burn sensitive Vegetation Index (VI) to create dynamic thresholds that are applied to the composite data. The VI is derived from MODIS shortwave infrared atmospherically corrected surface reflectance bands 5 and 7 with a measure of temporal texture.",
-            copyright=None,
-        )
-        ds.add_layout_info(
-            [
-                ("Planet", "burned_mapping", "m_burn_date"),
-                ("Planet", "burned_mapping", "m_burn_uncertainty"),
-                ("Planet", "burned_mapping", "m_burn_qa"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="Planet",
-            endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
-            collection="modis-14A2-061",
-            category="fire detection",
-            temporality="D",
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://planetarycomputer.microsoft.com/dataset/modis-14A2-061",
-            info="The Moderate Resolution Imaging Spectroradiometer (MODIS) Thermal Anomalies and Fire 8-Day Version 6.1 data are generated at 1 kilometer (km) spatial resolution as a Level 3 product. The MOD14A2 gridded composite contains the maximum value of the individual fire pixel classes detected during the eight days of acquisition.",
-            copyright=None,
-        )
-        ds.add_layout_info(
-            [
-                ("Planet", "burned_mapping", "w_burn_qa"),
-                ("Planet", "burned_mapping", "w_burn_firemask"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="Planet",
-            endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
-            collection="jrc-gsw",
-            category="hydrogeography",
-            temporality=None,
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://planetarycomputer.microsoft.com/dataset/jrc-gsw",
-            info="Global surface water products from the European Commission Joint Research Centre, based on Landsat 5, 7, and 8 imagery. Layers in this collection describe the occurrence, change, and seasonality of surface water from 1984-2020.",
-            copyright="Copernicus Open Access Policy",
-        )
-        ds.add_layout_info(
-            [
-                ("Planet", "hydrogeography", "change"),
-                ("Planet", "hydrogeography", "extent"),
-                ("Planet", "hydrogeography", "occurrence"),
-                ("Planet", "hydrogeography", "transitions"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="Element84",
-            endpoint="https://earth-search.aws.element84.com/v1",
-            collection="sentinel-2-l2a",
-            category="multispectral",
-            temporality="s",
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://registry.opendata.aws/sentinel-2-l2a-cogs/",
-            info="Sentinel-2 mission is a land monitoring constellation of two satellites providing high resolution optical imagery with a resolution of up to 10m. The mission provides a global coverage of the Earth's land surface every 5 days. This dataset contains all of the scenes in the original Sentinel-2 Public Dataset, except the JP2K files were converted into Cloud-Optimized GeoTIFFs (COGs). L2A data are available from April 2017 over wider Europe region and globally since December 2018.",
-            copyright=None,
-        )
-        ds.add_layout_info(
-            [
-                ("Element84", "reflectance", "s2_band01"),
-                ("Element84", "reflectance", "s2_band02"),
-                ("Element84", "reflectance", "s2_band03"),
-                ("Element84", "reflectance", "s2_band04"),
-                ("Element84", "reflectance", "s2_band05"),
-                ("Element84", "reflectance", "s2_band06"),
-                ("Element84", "reflectance", "s2_band07"),
-                ("Element84", "reflectance", "s2_band08"),
-                ("Element84", "reflectance", "s2_band08A"),
-                ("Element84", "reflectance", "s2_band09"),
-                ("Element84", "reflectance", "s2_band11"),
-                ("Element84", "reflectance", "s2_band12"),
-                ("Element84", "classification", "scl"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="ASF",
-            endpoint="https://stac.asf.alaska.edu",
-            collection="sentinel-1-global-coherence",
-            category="SAR",
-            temporality="3M",
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://registry.opendata.aws/ebd-sentinel-1-global-coherence-backscatter/",
-            info="Global C-band Synthetic Aperture Radar (SAR) interferometric repeat-pass coherence and backscatter signatures from Sentinel-1. Timeframe: 1-Dec-2019 to 30-Nov-2020 processed in seasonal manner (December-February, March-May, June-August, September-November) with a pixel spacing of three arcseconds. Coverage comprises land masses and ice sheets from 82° Northern to 79° Southern latitudes.",
-            copyright="Creative Commons Zero (CC0) 1.0 Universal License",
-        )
-        ds.add_layout_info(
-            [
-                ("ASF", "coherence", "s1_coh6_vv"),
-                ("ASF", "coherence", "s1_coh6_hh"),
-                ("ASF", "coherence", "s1_coh12_vv"),
-                ("ASF", "coherence", "s1_coh12_hh"),
-                ("ASF", "coherence", "s1_coh18_vv"),
-                ("ASF", "coherence", "s1_coh18_hh"),
-                ("ASF", "coherence", "s1_coh24_vv"),
-                ("ASF", "coherence", "s1_coh24_hh"),
-                ("ASF", "coherence", "s1_coh36_vv"),
-                ("ASF", "coherence", "s1_coh36_hh"),
-                ("ASF", "coherence", "s1_coh48_vv"),
-                ("ASF", "coherence", "s1_coh48_hh"),
-                ("ASF", "reflectance", "s1_amp_vv"),
-                ("ASF", "reflectance", "s1_amp_vh"),
-                ("ASF", "reflectance", "s1_amp_hv"),
-                ("ASF", "reflectance", "s1_amp_hh"),
-                ("ASF", "reflectance", "s1_inc"),
-            ],
-        )
-        self.add(ds)
-
-        ds = Dataset(
-            provider="ASF",
-            endpoint="https://stac.asf.alaska.edu",
-            collection="glo-30-hand",
-            category="hydrogeography",
-            temporality=None,
-            temporal_extent=None,
-            spatial_extent=None,
-            src="https://registry.opendata.aws/glo-30-hand/",
-            info="Height Above Nearest Drainage (HAND) is a terrain model that normalizes topography to the relative heights along the drainage network and is used to describe the relative soil gravitational potentials or the local drainage potentials. Each pixel value represents the vertical distance to the nearest drainage. The HAND data provides near-worldwide land coverage at 30 meters and was produced from the 2021 release of the Copernicus GLO-30 Public DEM. The HAND data are provided as a tiled set of Cloud Optimized GeoTIFFs (COGs) with 30-meter (1 arcsecond) pixel spacing.",
-            copyright="Creative Commons Attribution 4.0",
-        )
-        ds.add_layout_info(
-            [("ASF", "hydrogeography", "hand")],
-        )
-        self.add(ds)
+        for spec in _DEFAULT_DATASETS:
+            params = {k: v for k, v in spec.items() if k != "layout_keys"}
+            ds = Dataset(**params)
+            ds.add_layout_info(list(spec["layout_keys"]))
+            self.add(ds)
+        self._resolve_extents()
+
+    @staticmethod
+    def _open_cache(cache_path, mode):
+        """Opens a catalog cache file, (de)compressing it if it's gzipped."""
+        if cache_path.endswith(".gz"):
+            return gzip.open(cache_path, mode)
+        return open(cache_path, mode)
+
+
+# datasets of the default catalog (see `DatasetCatalog._load_defaults`)
+_DEFAULT_DATASETS = (
+    dict(
+        provider="Planet",
+        endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
+        collection="sentinel-1-rtc",
+        category="SAR",
+        temporality="s",
+        src="https://planetarycomputer.microsoft.com/dataset/sentinel-1-rtc",
+        info="Sentinel-1 represent radar imaging (SAR) satellites launched in 2014 and 2016 with a 6 days revisit cycle. It's C-Band radar has the ability to penetrate clouds. The Sentinel-1 RTC data in this collection is a radiometrically terrain corrected product (gamma naught values) derived from the Ground Range Detected (GRD) Level-1 products produced by the European Space Agency. It accounts for terrain variations that affect both the position of a given point on the Earth's surface and the brightness of the radar return, as expressed in radar geometry. Without treatment, the hill-slope modulations of the radiometry threaten to overwhelm weaker thematic land cover-induced backscatter differences. Additionally, comparison of backscatter from multiple satellites, modes, or tracks loses meaning.",
+        copyright="CC BY 4.0",
+        layout_keys=[
+            ("Planet", "reflectance", "s1_amp_vv"),
+            ("Planet", "reflectance", "s1_amp_vh"),
+            ("Planet", "reflectance", "s1_amp_hv"),
+            ("Planet", "reflectance", "s1_amp_hh"),
+        ],
+    ),
+    dict(
+        provider="Planet",
+        endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
+        collection="sentinel-2-l2a",
+        category="multispectral",
+        temporality="s",
+        src="https://planetarycomputer.microsoft.com/dataset/sentinel-2-l2a",
+        info="The Sentinel-2 program provides global imagery in thirteen spectral bands at 10m-60m resolution and a revisit time of approximately five days. This dataset represents the global Sentinel-2 archive, from 2016 to the present, processed to L2A (bottom-of-atmosphere) using Sen2Cor and converted to cloud-optimized GeoTIFF format.",
+        copyright="Copernicus Sentinel Data Terms",
+        layout_keys=[
+            ("Planet", "reflectance", "s2_band01"),
+            ("Planet", "reflectance", "s2_band02"),
+            ("Planet", "reflectance", "s2_band03"),
+            ("Planet", "reflectance", "s2_band04"),
+            ("Planet", "reflectance", "s2_band05"),
+            ("Planet", "reflectance", "s2_band06"),
+            ("Planet", "reflectance", "s2_band07"),
+            ("Planet", "reflectance", "s2_band08"),
+            ("Planet", "reflectance", "s2_band08A"),
+            ("Planet", "reflectance", "s2_band09"),
+            ("Planet", "reflectance", "s2_band11"),
+            ("Planet", "reflectance", "s2_band12"),
+            ("Planet", "classification", "scl"),
+        ],
+    ),
+    dict(
+        provider="Planet",
+        endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
+        collection="landsat-c2-l2",
+        category="multispectral",
+        temporality="s",
+        src="https://planetarycomputer.microsoft.com/dataset/landsat-c2-l2",
+        info="Landsat Collection 2 Level-2 Science Products, consisting of atmospherically corrected surface reflectance and surface temperature image data. Collection 2 Level-2 Science Products are available from August 22, 1982 to present.This dataset represents the global archive acquired by the Thematic Mapper onboard Landsat 4 and 5, the Enhanced Thematic Mapper onboard Landsat 7, and the Operatational Land Imager and Thermal Infrared Sensor onboard Landsat 8 and 9.",
+        copyright="Public Domain (https://www.usgs.gov/emergency-operations-portal/data-policy)",
+        layout_keys=[
+            ("Planet", "reflectance", "lndst_coastal"),
+            ("Planet", "reflectance", "lndst_blue"),
+            ("Planet", "reflectance", "lndst_green"),
+            ("Planet", "reflectance", "lndst_red"),
+            ("Planet", "reflectance", "lndst_nir08"),
+            ("Planet", "reflectance", "lndst_swir16"),
+            ("Planet", "reflectance", "lndst_swir22"),
+            ("Planet", "reflectance", "lndst_lwir109"),
+            ("Planet", "reflectance", "lndst_lwir114"),
+            ("Planet", "reflectance", "lndst_qa"),
+        ],
+    ),
+    dict(
+        provider="Planet",
+        endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
+        collection="esa-worldcover",
+        category="landcover",
+        temporality="Y",
+        src="https://planetarycomputer.microsoft.com/dataset/esa-worldcover",
+        info="The European Space Agency (ESA) WorldCover product provides global land cover maps for the years 2020 and 2021 at 10 meter resolution based on the combination of Sentinel-1 radar data and Sentinel-2 imagery. The discrete classification maps provide 11 classes defined using the Land Cover Classification System (LCCS) developed by the United Nations (UN) Food and Agriculture Organization (FAO). The map images are stored in cloud-optimized GeoTIFF format. The WorldCover product is developed by a consortium of European service providers and research organizations. VITO (Belgium) is the prime contractor of the WorldCover consortium.",
+        copyright="Creative Commons Attribution 4.0 International License",
+        layout_keys=[
+            ("Planet", "classification", "esa_lc"),
+        ],
+    ),
+    dict(
+        provider="Planet",
+        endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
+        collection="io-lulc-annual-v02",
+        category="landcover",
+        temporality="Y",
+        src="https://planetarycomputer.microsoft.com/dataset/io-lulc-annual-v02",
+        info="Time series of annual global maps of land use and land cover (LULC). It currently has data from 2017-2023. The maps are derived from ESA Sentinel-2 imagery at 10m resolution. Each map is a composite of LULC predictions for 9 classes throughout the year in order to generate a representative snapshot of each year. This dataset is produced by Impact Observatory, Microsoft, and Esri. This dataset was generated by Impact Observatory, which used billions of human-labeled pixels (curated by the National Geographic Society) to train a deep learning model for land classification.",
+        copyright="Creative Commons BY-4.0",
+        layout_keys=[
+            ("Planet", "classification", "impact_lc"),
+        ],
+    ),
+    dict(
+        provider="Planet",
+        endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
+        collection="nasadem",
+        category="DEM",
+        temporality=None,
+        src="https://planetarycomputer.microsoft.com/dataset/nasadem",
+        info="NASADEM provides global topographic data at 1 arc-second (~30m) horizontal resolution, derived primarily from data captured via the Shuttle Radar Topography Mission (SRTM).",
+        copyright="Public Domain (https://lpdaac.usgs.gov/data/data-citation-and-policies/)",
+        layout_keys=[
+            ("Planet", "topography", "dem"),
+        ],
+    ),
+    dict(
+        provider="Planet",
+        endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
+        collection="cop-dem-glo-30",
+        category="DSM",
+        temporality=None,
+        src="https://planetarycomputer.microsoft.com/dataset/cop-dem-glo-30",
+        info="The Copernicus DEM is a digital surface model (DSM), which represents the surface of the Earth including buildings, infrastructure, and vegetation. This DSM is based on radar satellite data acquired during the TanDEM-X Mission, which was funded by a public-private partnership between the German Aerospace Centre (DLR) and Airbus Defence and Space. Copernicus DEM is available at both 30-meter and 90-meter resolution; this dataset has a horizontal resolution of approximately 30 meters.",
+        copyright=None,
+        layout_keys=[
+            ("Planet", "topography", "dsm"),
+        ],
+    ),
+    dict(
+        provider="Planet",
+        endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
+        collection="modis-64A1-061",
+        category="fire detection",
+        temporality="M",
+        src="https://planetarycomputer.microsoft.com/dataset/modis-64A1-061",
+        info="The Terra and Aqua combined MCD64A1 Version 6.1 Burned Area data product is a monthly, global gridded 500 m product containing per-pixel burned-area and quality information. The MCD64A1 burned-area mapping approach employs 500 m Moderate Resolution Imaging Spectroradiometer (MODIS) Surface Reflectance imagery coupled with 1 kilometer (km) MODIS active fire observations. The algorithm uses a burn sensitive Vegetation Index (VI) to create dynamic thresholds that are applied to the composite data. The VI is derived from MODIS shortwave infrared atmospherically corrected surface reflectance bands 5 and 7 with a measure of temporal texture.",
+        copyright=None,
+        layout_keys=[
+            ("Planet", "burned_mapping", "m_burn_date"),
+            ("Planet", "burned_mapping", "m_burn_uncertainty"),
+            ("Planet", "burned_mapping", "m_burn_qa"),
+        ],
+    ),
+    dict(
+        provider="Planet",
+        endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
+        collection="modis-14A2-061",
+        category="fire detection",
+        temporality="D",
+        src="https://planetarycomputer.microsoft.com/dataset/modis-14A2-061",
+        info="The Moderate Resolution Imaging Spectroradiometer (MODIS) Thermal Anomalies and Fire 8-Day Version 6.1 data are generated at 1 kilometer (km) spatial resolution as a Level 3 product. The MOD14A2 gridded composite contains the maximum value of the individual fire pixel classes detected during the eight days of acquisition.",
+        copyright=None,
+        layout_keys=[
+            ("Planet", "burned_mapping", "w_burn_qa"),
+            ("Planet", "burned_mapping", "w_burn_firemask"),
+        ],
+    ),
+    dict(
+        provider="Planet",
+        endpoint="https://planetarycomputer.microsoft.com/api/stac/v1",
+        collection="jrc-gsw",
+        category="hydrogeography",
+        temporality=None,
+        src="https://planetarycomputer.microsoft.com/dataset/jrc-gsw",
+        info="Global surface water products from the European Commission Joint Research Centre, based on Landsat 5, 7, and 8 imagery. Layers in this collection describe the occurrence, change, and seasonality of surface water from 1984-2020.",
+        copyright="Copernicus Open Access Policy",
+        layout_keys=[
+            ("Planet", "hydrogeography", "change"),
+            ("Planet", "hydrogeography", "extent"),
+            ("Planet", "hydrogeography", "occurrence"),
+            ("Planet", "hydrogeography", "transitions"),
+        ],
+    ),
+    dict(
+        provider="Element84",
+        endpoint="https://earth-search.aws.element84.com/v1",
+        collection="sentinel-2-l2a",
+        category="multispectral",
+        temporality="s",
+        src="https://registry.opendata.aws/sentinel-2-l2a-cogs/",
+        info="Sentinel-2 mission is a land monitoring constellation of two satellites providing high resolution optical imagery with a resolution of up to 10m. The mission provides a global coverage of the Earth's land surface every 5 days. This dataset contains all of the scenes in the original Sentinel-2 Public Dataset, except the JP2K files were converted into Cloud-Optimized GeoTIFFs (COGs). L2A data are available from April 2017 over wider Europe region and globally since December 2018.",
+        copyright=None,
+        layout_keys=[
+            ("Element84", "reflectance", "s2_band01"),
+            ("Element84", "reflectance", "s2_band02"),
+            ("Element84", "reflectance", "s2_band03"),
+            ("Element84", "reflectance", "s2_band04"),
+            ("Element84", "reflectance", "s2_band05"),
+            ("Element84", "reflectance", "s2_band06"),
+            ("Element84", "reflectance", "s2_band07"),
+            ("Element84", "reflectance", "s2_band08"),
+            ("Element84", "reflectance", "s2_band08A"),
+            ("Element84", "reflectance", "s2_band09"),
+            ("Element84", "reflectance", "s2_band11"),
+            ("Element84", "reflectance", "s2_band12"),
+            ("Element84", "classification", "scl"),
+        ],
+    ),
+    dict(
+        provider="ASF",
+        endpoint="https://stac.asf.alaska.edu",
+        collection="sentinel-1-global-coherence",
+        category="SAR",
+        temporality="3M",
+        src="https://registry.opendata.aws/ebd-sentinel-1-global-coherence-backscatter/",
+        info="Global C-band Synthetic Aperture Radar (SAR) interferometric repeat-pass coherence and backscatter signatures from Sentinel-1. Timeframe: 1-Dec-2019 to 30-Nov-2020 processed in seasonal manner (December-February, March-May, June-August, September-November) with a pixel spacing of three arcseconds. Coverage comprises land masses and ice sheets from 82° Northern to 79° Southern latitudes.",
+        copyright="Creative Commons Zero (CC0) 1.0 Universal License",
+        layout_keys=[
+            ("ASF", "coherence", "s1_coh6_vv"),
+            ("ASF", "coherence", "s1_coh6_hh"),
+            ("ASF", "coherence", "s1_coh12_vv"),
+            ("ASF", "coherence", "s1_coh12_hh"),
+            ("ASF", "coherence", "s1_coh18_vv"),
+            ("ASF", "coherence", "s1_coh18_hh"),
+            ("ASF", "coherence", "s1_coh24_vv"),
+            ("ASF", "coherence", "s1_coh24_hh"),
+            ("ASF", "coherence", "s1_coh36_vv"),
+            ("ASF", "coherence", "s1_coh36_hh"),
+            ("ASF", "coherence", "s1_coh48_vv"),
+            ("ASF", "coherence", "s1_coh48_hh"),
+            ("ASF", "reflectance", "s1_amp_vv"),
+            ("ASF", "reflectance", "s1_amp_vh"),
+            ("ASF", "reflectance", "s1_amp_hv"),
+            ("ASF", "reflectance", "s1_amp_hh"),
+            ("ASF", "reflectance", "s1_inc"),
+        ],
+    ),
+    dict(
+        provider="ASF",
+        endpoint="https://stac.asf.alaska.edu",
+        collection="glo-30-hand",
+        category="hydrogeography",
+        temporality=None,
+        src="https://registry.opendata.aws/glo-30-hand/",
+        info="Height Above Nearest Drainage (HAND) is a terrain model that normalizes topography to the relative heights along the drainage network and is used to describe the relative soil gravitational potentials or the local drainage potentials. Each pixel value represents the vertical distance to the nearest drainage. The HAND data provides near-worldwide land coverage at 30 meters and was produced from the 2021 release of the Copernicus GLO-30 Public DEM. The HAND data are provided as a tiled set of Cloud Optimized GeoTIFFs (COGs) with 30-meter (1 arcsecond) pixel spacing.",
+        copyright="Creative Commons Attribution 4.0",
+        layout_keys=[
+            ("ASF", "hydrogeography", "hand"),
+        ],
+    ),
+)
+
+
+def __getattr__(name):
+    # default catalog (`ds_catalog`), loaded from the cache on first access
+    if name == "ds_catalog":
+        global ds_catalog
+        ds_catalog = DatasetCatalog()
+        ds_catalog.load()
+        return ds_catalog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,13 +8,14 @@ import os
 import shutil
 import stac_asset
 import time
-from aiohttp_retry import RetryClient, ExponentialRetry
+from aiohttp_retry import RetryClient, JitterRetry
 from copy import deepcopy
 from datetime import datetime
 from semantique.datacube import STACCube
 from shapely.geometry import shape
 from shapely.ops import unary_union
 from stac_asset.http_client import HttpClient
+from stac_asset.messages import WriteChunk
 from stac_asset.planetary_computer_client import PlanetaryComputerClient
 from tqdm import tqdm
 from tempfile import TemporaryDirectory
@@ -260,25 +261,33 @@ class _STACDownloader:
         """
         Executes the download processes in a retry manner.
         """
-        for i in range(self.retries):
-            print(f"Download loop {i}")
-            # Download & cleanup
-            await self._async_download(**self.kwargs)
-            self._remove_empty_items(self.out_dir)
-            # Check if current item collection contains all items
-            coll_path = os.path.join(self.out_dir, "item-collection.json")
-            coll = pystac.ItemCollection.from_file(coll_path)
-            ratio = len(coll) / len(self.item_coll)
-            if ratio == 1.0:
-                break
-            elif i < self.retries - 1:
-                print("Retry download to get all items.")
-            else:
-                print("Not all items retrieved. Please check the download process.")
+        # connection pool shared by all download clients, such that
+        # connections (incl. TLS handshakes & DNS lookups) are reused
+        self._connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=600)
+        try:
+            for i in range(self.retries):
+                print(f"Download loop {i}")
+                # Download & cleanup
+                await self._async_download(**self.kwargs)
+                self._remove_empty_items(self.out_dir)
+                # Check if current item collection contains all items
+                coll_path = os.path.join(self.out_dir, "item-collection.json")
+                coll = pystac.ItemCollection.from_file(coll_path)
+                ratio = len(coll) / len(self.item_coll)
+                if ratio == 1.0:
+                    break
+                elif i < self.retries - 1:
+                    print("Retry download to get all items.")
+                else:
+                    print("Not all items retrieved. Please check the download process.")
+        finally:
+            await self._connector.close()
         print(f"Downloaded items: {len(coll)}/{len(self.item_coll)}")
         print(f"Success rate: {ratio:.2%}")
 
-    async def _async_download(self, preview_size=10, reauth_batch_size=1000):
+    async def _async_download(
+        self, preview_size=10, reauth_batch_size=1000, max_concurrent_downloads=100
+    ):
         """
         Download the items in the item collection to the output directory asynchronously.
 
@@ -293,115 +302,133 @@ class _STACDownloader:
                 download is done in a synchronous way. If reauth_batch_size is None,
                 no reauthentication will be performed and all items will be downloaded
                 in a completely asnychronous manner.
+            max_concurrent_downloads (int): The maximum number of assets downloaded
+                concurrently. Defaults to the size of the shared connection pool.
         """
         # Set up download parameters
-        opt_retry = ExponentialRetry(attempts=self.retries)
-        opt_timeout = aiohttp.client.ClientTimeout(total=1800)
+        opt_retry = JitterRetry(
+            attempts=self.retries,
+            start_timeout=0.5,
+            max_timeout=30,
+            factor=2.0,
+            random_interval_size=1.0,
+        )
+        # stalled connections/transfers are detected via the socket timeouts
+        # long before the overall timeout is reached
+        opt_timeout = aiohttp.client.ClientTimeout(
+            total=1800, sock_connect=30, sock_read=120
+        )
         stac_config = dict(warn=True)
         if self.assets:
             stac_config["include"] = self.assets
         stac_config = stac_asset.Config(**stac_config)
 
+        # Estimate size from the assets' metadata (STAC file extension)
+        total_size = self._file_size_estimate()
+        if total_size is not None:
+            print(
+                f"Estimated total size: {_STACDownloader._sizeof_fmt(total_size)} "
+                "(based on file:size metadata)"
+            )
+
         # Preview run to estimate size
-        if len(self.item_coll) >= preview_size:
+        elif len(self.item_coll) >= preview_size:
             print("Estimating size of download...")
 
-            # Perform download for subsample
-            with TemporaryDirectory() as temp_dir:
+            # Subsample items for preview run
+            np.random.seed(42)
+            pre_coll = np.random.choice(
+                self.item_coll, size=preview_size, replace=False
+            )
+            pre_coll = pystac.ItemCollection(items=pre_coll)
 
-                # Subsample items for preview run
-                np.random.seed(42)
-                pre_coll = np.random.choice(
-                    self.item_coll, size=preview_size, replace=False
-                )
-                pre_coll = pystac.ItemCollection(items=pre_coll)
+            # Retrieve sizes from the HTTP headers if possible
+            item_sizes = await self._head_item_sizes(
+                pre_coll, opt_timeout, sign=reauth_batch_size is not None
+            )
 
-                # Starting the progress bar / message handler
-                messages = asyncio.Queue()
-                message_handler_task = asyncio.create_task(
-                    self._async_message_handling(messages, len(pre_coll), temp_dir)
-                )
+            # Otherwise perform download for subsample
+            if item_sizes is None:
+                with TemporaryDirectory() as temp_dir:
 
-                # Downloading the item collection in batched manner
-                batch_size = reauth_batch_size or len(pre_coll)
-                for i in range(0, len(pre_coll), batch_size):
-                    # create single batch
-                    batch = pre_coll[i : i + batch_size]
-                    # reauth 
-                    if reauth_batch_size is not None:
-                        signed = False
-                        on_hold_count = 0
-                        while not signed:
-                            try:
-                                batch = STACCube._sign_metadata(list(batch))
-                                signed = True
-                            except:
-                                on_hold_count += 1
-                                if on_hold_count == 1:
-                                    now = time.strftime(
-                                        "%Y-%m-%d %H:%M:%S",
-                                        time.localtime(time.time())
-                                    )
-                                    print(f"{now}: Download paused due to resign_error.")
-                                time.sleep(1)
-                        if on_hold_count:
-                            print(f"{now}: Download will be continued after resign_error.")
-                    else:
-                        batch = pystac.ItemCollection(items=batch)
-                    batch = pystac.ItemCollection(deepcopy(batch))
-
-                    await stac_asset.download_item_collection(
-                        item_collection=batch,
-                        directory=temp_dir,
-                        keep_non_downloaded=False,
-                        config=stac_config,
-                        clients=[
-                            HttpClient(
-                                RetryClient(
-                                    aiohttp.ClientSession(timeout=opt_timeout),
-                                    retry_options=opt_retry,
-                                ),
-                                check_content_type=False,
-                            ),
-                            PlanetaryComputerClient(
-                                RetryClient(
-                                    aiohttp.ClientSession(timeout=opt_timeout),
-                                    retry_options=opt_retry,
-                                ),
-                                check_content_type=False,
-                            ),
-                        ],
-                        messages=messages,
+                    # Starting the progress bar / message handler
+                    messages = asyncio.Queue()
+                    message_handler_task = asyncio.create_task(
+                        self._async_message_handling(messages, len(pre_coll))
                     )
 
-                # Signal the message handler to stop
-                await messages.put(None)
-                await message_handler_task
-
-                # Clean directory
-                self._remove_empty_items(temp_dir)
-
-                # Evaluate size
-                n_items = len(os.listdir(temp_dir))
-                mean_size = (
-                    _STACDownloader._get_dir_size(temp_dir)
-                    / n_items
-                    * len(self.item_coll)
-                )
-                sub_dirs = [os.path.join(temp_dir, x.id) for x in pre_coll]
-                std_size = np.std([_STACDownloader._get_dir_size(x) for x in sub_dirs])
+                    # Downloading the item collection in batched manner
+                    batch_size = reauth_batch_size or len(pre_coll)
+                    for i in range(0, len(pre_coll), batch_size):
+                        # create single batch
+                        batch = pre_coll[i : i + batch_size]
+                        # reauth 
+                        if reauth_batch_size is not None:
+                            signed = False
+                            on_hold_count = 0
+                            while not signed:
+                                try:
+                                    batch = STACCube._sign_metadata(list(batch))
+                                    signed = True
+                                except:
+                                    on_hold_count += 1
+                                    if on_hold_count == 1:
+                                        now = time.strftime(
+                                            "%Y-%m-%d %H:%M:%S",
+                                            time.localtime(time.time())
+                                        )
+                                        print(f"{now}: Download paused due to resign_error.")
+                                    time.sleep(1)
+                            if on_hold_count:
+                                print(f"{now}: Download will be continued after resign_error.")
+                        else:
+                            batch = pystac.ItemCollection(items=batch)
+                        batch = pystac.ItemCollection(deepcopy(batch))
+
+                        await stac_asset.download_item_collection(
+                            item_collection=batch,
+                            directory=temp_dir,
+                            keep_non_downloaded=False,
+                            config=stac_config,
+                            clients=self._create_clients(opt_timeout, opt_retry),
+                            messages=messages,
+                            max_concurrent_downloads=max_concurrent_downloads,
+                        )
+
+                    # Signal the message handler to stop
+                    await messages.put(None)
+                    await message_handler_task
+
+                    # Clean directory
+                    self._remove_empty_items(temp_dir)
+
+                    # Sizes of the downloaded items
+                    sub_dirs = [os.path.join(temp_dir, x.id) for x in pre_coll]
+                    item_sizes = [
+                        _STACDownloader._get_dir_size(x)
+                        for x in sub_dirs
+                        if os.path.isdir(x)
+                    ]
+
+            # Evaluate size
+            n_items = len(item_sizes)
+            if n_items > 1:
+                mean_size = np.mean(item_sizes) * len(self.item_coll)
+                std_size = np.std(item_sizes)
                 ci_size = 1.96 * std_size / ((n_items - 1) ** 0.5) * len(self.item_coll)
                 print(
                     f"Estimated total size: {_STACDownloader._sizeof_fmt(mean_size)} \xb1 "
                     f"{_STACDownloader._sizeof_fmt(ci_size)} (95% confidence interval)"
                 )
+            else:
+                print("Not enough items retrieved to estimate size.")
         else:
             print("Not enough items to estimate size. Skipping preview run.")
 
         # Starting the progress bar / message handler
         messages = asyncio.Queue()
         message_handler_task = asyncio.create_task(
-            self._async_message_handling(messages, len(self.item_coll), self.out_dir)
+            self._async_message_handling(messages, len(self.item_coll))
         )
 
         # Downloading the item collection in batched manner
@@ -439,23 +466,9 @@ class _STACDownloader:
                 keep_non_downloaded=False,
                 file_name=f"item-collection-batch-{i}.json",
                 config=stac_config,
-                clients=[
-                    HttpClient(
-                        RetryClient(
-                            aiohttp.ClientSession(timeout=opt_timeout),
-                            retry_options=opt_retry,
-                        ),
-                        check_content_type=False,
-                    ),
-                    PlanetaryComputerClient(
-                        RetryClient(
-                            aiohttp.ClientSession(timeout=opt_timeout),
-                            retry_options=opt_retry,
-                        ),
-                        check_content_type=False,
-                    ),
-                ],
+                clients=self._create_clients(opt_timeout, opt_retry),
                 messages=messages,
+                max_concurrent_downloads=max_concurrent_downloads,
             )
 
         # Signal the message handler to stop
@@ -476,17 +489,125 @@ class _STACDownloader:
         item_coll = pystac.ItemCollection(items=all_items)
         item_coll.save_object(os.path.join(self.out_dir, "item-collection.json"))
 
-    async def _async_message_handling(
-        self, messages, total_files, directory, interval=1
-    ):
+    def _file_size_estimate(self, min_coverage=0.5):
+        """
+        Estimates the download size from the "file:size" fields of the assets.
+
+        Args:
+            min_coverage (float): The minimum share of assets to be downloaded
+                that need to provide their size. Sizes of the remaining assets
+                are extrapolated from the provided ones.
+
+        Returns:
+            float or None: The estimated size in bytes or None, if too few
+                assets provide their size.
+        """
+        n_assets, sizes = 0, []
+        for item in self.item_coll:
+            for key, asset in item.assets.items():
+                if self.assets and key not in self.assets:
+                    continue
+                n_assets += 1
+                size = asset.extra_fields.get("file:size")
+                if size is not None:
+                    sizes.append(size)
+        if not n_assets or len(sizes) < min_coverage * n_assets:
+            return None
+        return sum(sizes) * n_assets / len(sizes)
+
+    async def _head_item_sizes(self, items, timeout, sign=True):
+        """
+        Retrieves the sizes of the items (i.e. their assets to be downloaded)
+        from the Content-Length of HEAD requests, without downloading them.
+
+        Args:
+            items (pystac.ItemCollection): The items to retrieve the sizes for.
+            timeout (aiohttp.ClientTimeout): The timeout of the requests.
+            sign (bool): Whether to sign the items before sending the requests.
+
+        Returns:
+            list or None: The item sizes in bytes or None, if the sizes can't be
+                retrieved that way (e.g. HEAD not supported or no Content-Length).
+        """
+        try:
+            items = deepcopy(list(items))
+            if sign:
+                items = STACCube._sign_metadata(items)
+        except Exception:
+            return None
+        hrefs = [
+            [
+                asset.href
+                for key, asset in item.assets.items()
+                if not self.assets or key in self.assets
+            ]
+            for item in items
+        ]
+
+        async def _content_length(session, href):
+            async with session.head(href, allow_redirects=True) as response:
+                if response.status != 200 or response.content_length is None:
+                    raise ValueError(f"No content length retrievable for {href}")
+                return response.content_length
+
+        session = aiohttp.ClientSession(
+            connector=self._connector,
+            connector_owner=False,
+            timeout=timeout,
+        )
+        async with session:
+            # all requests are awaited before the session is closed,
+            # failed ones are returned rather than raised
+            sizes = await asyncio.gather(
+                *[
+                    _content_length(session, href)
+                    for item_hrefs in hrefs
+                    for href in item_hrefs
+                ],
+                return_exceptions=True,
+            )
+        # fall back to the preview run if any size is missing
+        if any(isinstance(x, BaseException) for x in sizes):
+            return None
+        # sum up the asset sizes per item
+        item_sizes, pos = [], 0
+        for item_hrefs in hrefs:
+            item_sizes.append(sum(sizes[pos : pos + len(item_hrefs)]))
+            pos += len(item_hrefs)
+        return item_sizes
+
+    def _create_clients(self, timeout, retry_options):
+        """
+        Creates the HTTP & Planetary Computer download clients. Their sessions
+        draw connections from the shared pool, which outlives the sessions
+        (i.e. closing the clients keeps the pooled connections alive).
+
+        Args:
+            timeout (aiohttp.ClientTimeout): The timeout of the sessions.
+            retry_options (aiohttp_retry.RetryOptionsBase): The retry options.
+        """
+        clients = []
+        for client_cls in (HttpClient, PlanetaryComputerClient):
+            session = aiohttp.ClientSession(
+                connector=self._connector,
+                connector_owner=False,
+                timeout=timeout,
+            )
+            clients.append(
+                client_cls(
+                    RetryClient(session, retry_options=retry_options),
+                    check_content_type=False,
+                )
+            )
+        return clients
+
+    async def _async_message_handling(self, messages, total_files):
         """
         Handle messages from the download process and update progress bars.
 
         Args:
             messages (asyncio.Queue): The queue to receive messages from the download process.
             total_files (int): The total number of files to download.
-            directory (str): The directory where the files are being downloaded.
-            interval (int): The interval in seconds at which to update the progress bars.
         """
         size_bar = tqdm(
             total=None,
@@ -494,47 +615,19 @@ class _STACDownloader:
             unit="B",
             unit_scale=True,
             unit_divisor=1024,
-            miniters=1,
         )
-        # variables to keep track of progress
-        last_checked = time.time()
-        prev_size = 0
-
-        # start the background task
-        background_task = asyncio.create_task(
-            self._calculate_dir_size(directory, interval)
-        )
-
         while True:
             message = await messages.get()
             # check finished
             if message is None:
                 break
-            # update every interval seconds
-            current_time = time.time()
-            if current_time - last_checked >= interval:
-                last_checked = current_time
-                size_bar.update(self._dir_size - prev_size)
-                prev_size = self._dir_size
-
-        # cancel the background task when done
-        background_task.cancel()
+            # account for written bytes (tqdm throttles the refreshes itself)
+            if isinstance(message, WriteChunk):
+                size_bar.update(message.size)
 
         # close the progress bars when done
         size_bar.close()
 
-    async def _calculate_dir_size(self, directory, interval):
-        """
-        Calculate the size of the directory at regular intervals.
-
-        Args:
-            directory (str): The directory to calculate the size of.
-            interval (int): The interval in seconds at which to calculate the size.
-        """
-        while True:
-            self._dir_size = _STACDownloader._get_dir_size(directory)
-            await asyncio.sleep(interval)
-
     def _remove_empty_items(self, out_path):
         """
         Remove empty item directories from the output directory.
@@ -549,11 +642,8 @@ class _STACDownloader:
         # update item collection
         coll_path = os.path.join(out_path, "item-collection.json")
         in_coll = pystac.ItemCollection.from_file(coll_path)
-        all_items = [x.id for x in in_coll.items]
-        rm_items = [os.path.split(x)[-1] for x in empty_dirs]
-        for id in rm_items:
-            all_items.remove(id)
-        keep_items = [x for x in in_coll.items if x.id in all_items]
+        rm_items = {os.path.split(x)[-1] for x in empty_dirs}
+        keep_items = [x for x in in_coll.items if x.id not in rm_items]
         out_coll = pystac.ItemCollection(items=keep_items)
         # write back to file
         out_coll.save_object(coll_path)
@@ -566,15 +656,19 @@ class _STACDownloader:
         Args:
             directory (str): The directory to search for empty subdirectories.
         """
+        if _STACDownloader._is_empty(directory):
+            return [directory]
         empty_dirs = []
-        for dirpath, dirnames, filenames in os.walk(directory):
-            if not dirnames and not filenames:
-                empty_dirs.append(dirpath)
-            for dirname in list(dirnames):
-                full_path = os.path.join(dirpath, dirname)
-                if not os.listdir(full_path):
-                    empty_dirs.append(full_path)
-                    dirnames.remove(dirname)
+        stack = [directory]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    if _STACDownloader._is_empty(entry.path):
+                        empty_dirs.append(entry.path)
+                    elif not entry.is_symlink():
+                        stack.append(entry.path)
         return empty_dirs
 
     @staticmethod
@@ -588,14 +682,23 @@ class _STACDownloader:
             int: Total size of files in the directory in bytes.
         """
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(directory):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                # skip if it is symbolic link
-                if not os.path.islink(fp):
-                    total_size += os.path.getsize(fp)
+        stack = [directory]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # skip symbolic links, stat results are cached by scandir
+                    if entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
         return total_size
 
+    @staticmethod
+    def _is_empty(directory):
+        """Check whether the given directory is empty."""
+        with os.scandir(directory) as entries:
+            return next(entries, None) is None
+
     @staticmethod
     def _sizeof_fmt(num, suffix="B"):
         """
@@ -1,3 +1,7 @@
+import copy
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import numpy as np
@@ -5,16 +9,183 @@ import os
 import pandas as pd
 import planetary_computer as pc
 import pystac
+import threading
+import time
 import xarray as xr
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pystac_client import Client
+from pystac_client.exceptions import APIError
 from pystac_client.stac_api_io import StacApiIO
 from semantique.processor.core import FakeProcessor
+from shapely.geometry import box, shape
+from shapely.geometry.base import BaseGeometry
+from shapely.prepared import prep
 from urllib3 import Retry
-from .datasets import Dataset
+from .datasets import _load_layout
 
 FILE_PATH = os.path.dirname(os.path.abspath(__file__))
 logger = logging.getLogger(__name__)
 
+# recent search results shared across finders, kept for SEARCH_CACHE_TTL seconds
+# (at most SEARCH_CACHE_SIZE of them, least recently used ones are evicted first)
+SEARCH_CACHE_TTL = 3600
+SEARCH_CACHE_SIZE = 32
+_SEARCH_CACHE = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+# search clients per catalog endpoint, reusing their root document and
+# HTTP connections across searches (opened under a per-endpoint lock)
+_CLIENTS = {}
+_CLIENT_LOCKS = {}
+_CLIENT_LOCKS_LOCK = threading.Lock()
+
+# data layers referenced by recipes, keyed by a hash of recipe, mapping &
+# further processor args (at most LAYER_REFS_CACHE_SIZE, least recently used
+# ones are evicted first)
+LAYER_REFS_CACHE_SIZE = 128
+_LAYER_REFS_CACHE = OrderedDict()
+_LAYER_REFS_CACHE_LOCK = threading.Lock()
+
+# connect & read timeout of searches
+SEARCH_TIMEOUT = (30, 1800)
+
+
+def _get_cached_search(key):
+    """
+    Returns a copy of the cached search results for the given key,
+    None if there are no (unexpired) results
+    """
+    with _SEARCH_CACHE_LOCK:
+        cached = _SEARCH_CACHE.get(key)
+        if cached is None:
+            return None
+        if time.time() - cached[0] >= SEARCH_CACHE_TTL:
+            del _SEARCH_CACHE[key]
+            return None
+        _SEARCH_CACHE.move_to_end(key)
+        return cached[1].clone()
+
+
+def _cache_search(key, item_coll):
+    """
+    Caches a copy of the search results, purging expired results and
+    evicting the least recently used ones beyond SEARCH_CACHE_SIZE
+    """
+    now = time.time()
+    with _SEARCH_CACHE_LOCK:
+        expired = [
+            k for k, v in _SEARCH_CACHE.items() if now - v[0] >= SEARCH_CACHE_TTL
+        ]
+        for k in expired:
+            del _SEARCH_CACHE[k]
+        _SEARCH_CACHE[key] = (now, item_coll.clone())
+        _SEARCH_CACHE.move_to_end(key)
+        while len(_SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+            _SEARCH_CACHE.popitem(last=False)
+
+
+def _get_cached_layer_refs(key):
+    """
+    Returns the cached layer references for the given key, None if not cached
+    """
+    with _LAYER_REFS_CACHE_LOCK:
+        layer_keys = _LAYER_REFS_CACHE.get(key)
+        if layer_keys is not None:
+            _LAYER_REFS_CACHE.move_to_end(key)
+        return layer_keys
+
+
+def _cache_layer_refs(key, layer_keys):
+    """
+    Caches the layer references, evicting the least recently used ones
+    beyond LAYER_REFS_CACHE_SIZE
+    """
+    with _LAYER_REFS_CACHE_LOCK:
+        _LAYER_REFS_CACHE[key] = layer_keys
+        _LAYER_REFS_CACHE.move_to_end(key)
+        while len(_LAYER_REFS_CACHE) > LAYER_REFS_CACHE_SIZE:
+            _LAYER_REFS_CACHE.popitem(last=False)
+
+
+def _get_client(endpoint):
+    """
+    Returns the search client shared by all searches on the given endpoint
+    """
+    # each endpoint is opened once, without blocking searches on other endpoints
+    with _CLIENT_LOCKS_LOCK:
+        lock = _CLIENT_LOCKS.setdefault(endpoint, threading.Lock())
+    with lock:
+        client = _CLIENTS.get(endpoint)
+        if client is None:
+            # exponential backoff with jitter, capped at 30s
+            retry = Retry(
+                total=5,
+                backoff_factor=0.5,
+                backoff_jitter=0.5,
+                backoff_max=30,
+                status_forcelist=[408, 502, 503, 504],
+                allowed_methods=None,
+            )
+            # Planetary Computer items are signed after postprocessing
+            client = Client.open(
+                endpoint,
+                stac_io=StacApiIO(max_retries=retry, timeout=SEARCH_TIMEOUT),
+                timeout=SEARCH_TIMEOUT,
+            )
+            _CLIENTS[endpoint] = client
+    return client
+
+
+class _UnresolvableReference(Exception):
+    pass
+
+
+def _extract_layer_refs(recipe, mapping):
+    """
+    Statically collects the data layers referenced by a recipe, either directly
+    or through the concepts it uses, by walking the recipe and mapping rules.
+    Returns the layer keys in the order they are first referenced
+
+    Raises _UnresolvableReference if a reference can't be resolved this way
+    """
+    # insertion-ordered dict used as an ordered set
+    layer_keys = {}
+    seen_concepts = set()
+    stack = [recipe]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            if obj.get("type") == "layer":
+                ref = obj.get("reference")
+                if not isinstance(ref, (list, tuple)) or not all(
+                    isinstance(x, str) for x in ref
+                ):
+                    raise _UnresolvableReference(ref)
+                layer_keys.setdefault(tuple(ref))
+                continue
+            if obj.get("type") == "concept":
+                ref = obj.get("reference")
+                if not isinstance(ref, (list, tuple)):
+                    raise _UnresolvableReference(ref)
+                # a selected property restricts the rules to that property
+                prop = obj.get("property")
+                if prop is not None and not isinstance(prop, str):
+                    raise _UnresolvableReference(ref)
+                if (tuple(ref), prop) not in seen_concepts:
+                    seen_concepts.add((tuple(ref), prop))
+                    rules = mapping
+                    for key in ref if prop is None else [*ref, prop]:
+                        if not isinstance(rules, dict) or key not in rules:
+                            raise _UnresolvableReference(ref)
+                        rules = rules[key]
+                    stack.append(rules)
+            # reversed, such that the recipe is walked in document order
+            stack.extend(reversed(list(obj.values())))
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(reversed(obj))
+    return tuple(layer_keys)
+
 
 class Finder:
     """
@@ -37,59 +208,164 @@ class Finder:
             ds_catalog (DatasetCatalog): Dataset catalog containing the data sets to be searched
             t_start (str): Start time of the search
             t_end (str): End time of the search
-            aoi (shapely.geometry): Area of interest in WGS84 coordinates (EPSG:4326)
+            aoi (shapely.geometry): Area of interest in WGS84 coordinates (EPSG:4326),
+                also accepted as GeoJSON (dict/str) or geo interface
             layout_file (str): Path to the datacube layout file
         """
         self.layout_file = layout_file
         self.ds_catalog = ds_catalog
         self.t_start = t_start
         self.t_end = t_end
+        # searches & prechecks rely on a shapely geometry
+        if isinstance(aoi, str):
+            aoi = json.loads(aoi)
+        if not isinstance(aoi, BaseGeometry):
+            aoi = shape(aoi)
         self.aoi = aoi
         self.params_search = {}
+        # layer key -> catalog table row, see _layer_index
+        self._layer_idx = None
 
-    def search_auto(self, recipe, mapping, **kwargs):
-        # fake run to resolve data references
-        fp = FakeProcessor(
-            recipe=recipe,
-            mapping=mapping,
-            datacube=None,
-            extent=xr.DataArray(),
-            **kwargs,
-        )
-        _ = fp.optimize().execute()
-        layer_keys = list(set([tuple(x) for x in fp.cache.seq]))
+    def search_auto(self, recipe, mapping, *, refresh=False, **kwargs):
+        """
+        Searches all data layers referenced by the recipe,
+        refresh=True bypasses (and updates) the cache of recent search results
+        """
+        # resolve data references, reusing results for identical recipes
+        # (processor args such as custom verbs are part of the key)
+        try:
+            cache_key = hashlib.blake2b(
+                json.dumps([recipe, mapping, kwargs], sort_keys=True).encode(),
+                digest_size=16,
+            ).hexdigest()
+        except (TypeError, ValueError):
+            # not JSON-serializable, resolve without caching
+            cache_key = None
+        layer_keys = None
+        if cache_key is not None:
+            layer_keys = _get_cached_layer_refs(cache_key)
+        if layer_keys is None:
+            layer_keys = Finder._resolve_layer_refs(recipe, mapping, **kwargs)
+            if cache_key is not None:
+                _cache_layer_refs(cache_key, layer_keys)
         # log info
         logger.info("The recipe references the following data layers:")
         for key in layer_keys:
             logger.info(key)
-        # run manual search for each data layer
-        item_colls = []
+        # group data layers of the same dataset, searched with a single query
+        groups = {}
         for layer_key in layer_keys:
-            self.search_man(layer_key)
-            item_colls.append(list(self.item_coll))
+            groups.setdefault(self._search_signature(layer_key), []).append(layer_key)
+        # run search for each group (concurrently)
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(groups)))) as pool:
+            results = list(
+                pool.map(
+                    functools.partial(self._search_group, refresh=refresh),
+                    groups.values(),
+                )
+            )
+        item_colls = itertools.chain.from_iterable(
+            group_colls for group_colls, _ in results
+        )
+        if results:
+            # keep the search params of the last layer as in a sequential search
+            self.params_search = results[-1][1]
         # compile results
-        self.item_coll = [x for sl in item_colls for x in sl]
-        self.item_coll = pystac.ItemCollection(self.item_coll)
+        self.item_coll = pystac.ItemCollection(
+            itertools.chain.from_iterable(item_colls)
+        )
         self.item_coll = self._merge_assets_per_item(self.item_coll)
 
-    def search_man(self, layer_key):
+    @staticmethod
+    def _resolve_layer_refs(recipe, mapping, **kwargs):
+        """
+        Resolves the data layers referenced by a recipe statically,
+        with a fake run as a fallback
+        """
+        try:
+            return _extract_layer_refs(recipe, mapping)
+        except _UnresolvableReference:
+            fp = FakeProcessor(
+                recipe=recipe,
+                mapping=mapping,
+                datacube=None,
+                extent=xr.DataArray(),
+                **kwargs,
+            )
+            _ = fp.optimize().execute()
+            # de-duplicated, keeping the order of the references
+            return tuple(dict.fromkeys(tuple(x) for x in fp.cache.seq))
+
+    def search_man(self, layer_key, *, refresh=False):
+        """
+        Searches a single data layer,
+        refresh=True bypasses (and updates) the cache of recent search results
+        """
         logger.info(f"Initialise search for {layer_key}")
         self._retrieve_params(layer_key)
         logger.info("Search started")
-        self._retrieve_metadata(layer_key)
+        self._retrieve_metadata(layer_key, refresh=refresh)
         logger.info("Search finished")
         self._postprocess_search(layer_key)
         logger.info("Search postprocessed")
         logger.info(f"Found {len(self.item_coll):d} datasets")
 
+    @staticmethod
+    def clear_search_cache():
+        """
+        Clears the cache of recent search results shared by all finders
+        """
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE.clear()
+
+    def _search_group(self, layer_keys, refresh=False):
+        """
+        Searches the data layers of the same dataset with a single query on a
+        copy of the finder (such that groups can be searched concurrently) and
+        postprocesses the results for each data layer
+        """
+        finder = copy.copy(self)
+        finder.params_search = {}
+        logger.info(f"Initialise search for {layer_keys}")
+        finder._retrieve_params(layer_keys[0])
+        finder._retrieve_metadata(layer_keys[0], refresh=refresh)
+        items = list(finder.item_coll)
+        item_colls = []
+        for i, layer_key in enumerate(layer_keys):
+            # each data layer gets its own copy of the items (except the last)
+            if i < len(layer_keys) - 1:
+                layer_items = [x.clone() for x in items]
+            else:
+                layer_items = items
+            finder._retrieve_params(layer_key)
+            finder.item_coll = pystac.ItemCollection(layer_items)
+            finder._postprocess_search(layer_key)
+            item_colls.append(finder.item_coll)
+            logger.info(f"Found {len(finder.item_coll):d} datasets for {layer_key}")
+        return item_colls, finder.params_search
+
+    def _search_signature(self, layer_key):
+        """
+        Returns the parameters distinguishing the STAC queries of data layers,
+        i.e. layers with the same signature can be searched with one query
+        """
+        ds_table = self.ds_catalog.parse_as_table(keys=None)
+        ds_entry = ds_table.iloc[self._layer_index(ds_table)[tuple(layer_key)]]
+        product_type = None
+        if (ds_entry["provider"] == "ASF") & (
+            ds_entry["collection"] == "sentinel-1-global-coherence"
+        ):
+            # product types are filtered server-side
+            product_type, _ = Finder._asf_coherence_filter(layer_key)
+        return ds_entry["endpoint"], ds_entry["collection"], product_type
+
     def _retrieve_params(self, layer_key):
         """
         Retrieves the data search parameters based on the specified inputs
         """
         # get specific collection
         ds_table = self.ds_catalog.parse_as_table(keys=None)
-        keep = ds_table["layout_keys"].apply(lambda x: layer_key in x)
-        ds_entry = ds_table[keep].iloc[0]
+        ds_entry = ds_table.iloc[self._layer_index(ds_table)[tuple(layer_key)]]
 
         # retrieve data parameters
         self.params_search["provider"] = ds_entry["provider"]
@@ -97,6 +373,8 @@ class Finder:
         self.params_search["collection"] = ds_entry["collection"]
         self.params_search["temp"] = ds_entry["temporality"]
         self.params_search["lkeys"] = ds_entry["layout_keys"]
+        self.params_search["t_extent"] = ds_entry["temporal_extent"]
+        self.params_search["s_extent"] = ds_entry["spatial_extent"]
         self.params_search["aoi"] = self.aoi
 
         # retrieve time range for query
@@ -106,42 +384,151 @@ class Finder:
         else:
             self.params_search["t_start"] = np.datetime64("1970-01-01")
             self.params_search["t_end"] = np.datetime64("today")
+        self.params_search["datetime_iso"] = [
+            np.datetime_as_string(self.params_search["t_start"], timezone="UTC"),
+            np.datetime_as_string(self.params_search["t_end"], timezone="UTC"),
+        ]
 
-    def _retrieve_metadata(self, layer_key):
+    def _layer_index(self, ds_table):
         """
-        Performs the data search based on the retrieved params
+        Maps the layer keys to the (first) row of the catalog table containing
+        them. Rebuilt only if the catalog returns a new table, i.e. if modified
         """
-        # init retry
-        retry = Retry(
-            total=5,
-            backoff_factor=1,
-            status_forcelist=[408, 502, 503, 504],
-            allowed_methods=None,
+        cached = self._layer_idx
+        if cached is None or cached[0] is not ds_table:
+            index = {}
+            for i, keys in enumerate(ds_table["layout_keys"]):
+                for key in keys:
+                    index.setdefault(tuple(key), i)
+            cached = (ds_table, index)
+            self._layer_idx = cached
+        return cached[1]
+
+    def _retrieve_metadata(self, layer_key, refresh=False):
+        """
+        Performs the data search based on the retrieved params,
+        with refresh=True even if the results of the search are cached
+        """
+        # search params
+        search_params = dict(
+            collections=self.params_search["collection"],
+            datetime=self.params_search["datetime_iso"],
+            intersects=self.params_search["aoi"],
+            # large pages to reduce the number of round trips
+            limit=1000,
         )
+        product_type = None
+        if self._is_asf_coherence():
+            product_type, _ = Finder._asf_coherence_filter(layer_key)
+
+        # skip searches that can't return any items
+        if self._outside_extent():
+            logger.info(f"Search window outside of the extent of {layer_key}")
+            self.item_coll = pystac.ItemCollection([])
+            return
+
+        # AOIs (nearly) filling their bounding box are searched by bbox,
+        # keeping requests small, and intersected exactly client-side
+        aoi = self.params_search["aoi"]
+        envelope_area = aoi.envelope.area
+        use_bbox = envelope_area > 0 and aoi.area >= 0.95 * envelope_area
+        if use_bbox:
+            del search_params["intersects"]
+            search_params["bbox"] = list(aoi.bounds)
+
+        # reuse results of identical searches made recently (unless refreshed,
+        # e.g. to get items newly added to the catalog)
+        cache_key = (
+            self.params_search["catalog"],
+            self.params_search["collection"],
+            tuple(search_params["datetime"]),
+            aoi.wkb,
+            product_type,
+        )
+        cached = None if refresh else _get_cached_search(cache_key)
+        if cached is not None:
+            self.item_coll = cached
+            return
 
         # init search client
-        if self.params_search["provider"] == "Planet":
-            catalog = Client.open(
-                self.params_search["catalog"],
-                modifier=pc.sign_inplace,
-                stac_io=StacApiIO(max_retries=retry, timeout=1800),
+        catalog = _get_client(self.params_search["catalog"])
+
+        # make search
+        item_coll = None
+        if product_type is not None:
+            # filter product types server-side where supported
+            # (exact matching is done during postprocessing in any case)
+            try:
+                query = catalog.search(
+                    **search_params,
+                    filter_lang="cql2-json",
+                    filter={
+                        "op": "=",
+                        "args": [{"property": "sar:product_type"}, product_type],
+                    },
+                )
+                item_coll = query.item_collection()
+            except APIError as e:
+                logger.info(f"Server-side filtering not supported: {e}")
+        if item_coll is None:
+            query = catalog.search(**search_params)
+            item_coll = query.item_collection()
+        if use_bbox:
+            prepared = prep(aoi)
+            item_coll = pystac.ItemCollection(
+                [
+                    x
+                    for x in item_coll
+                    if x.geometry is None or prepared.intersects(shape(x.geometry))
+                ]
             )
-        else:
-            catalog = Client.open(
-                self.params_search["catalog"],
-                stac_io=StacApiIO(max_retries=retry, timeout=1800),
+        _cache_search(cache_key, item_coll)
+        self.item_coll = item_coll
+
+    def _outside_extent(self):
+        """
+        Checks if the search window lies outside of the collection's
+        temporal or spatial extent (as far as known from the catalog)
+        """
+        t_start = self.params_search["t_start"]
+        t_end = self.params_search["t_end"]
+        if t_end < t_start:
+            return True
+        t_extent = self.params_search.get("t_extent")
+        if t_extent:
+            ext_start, ext_end = (
+                None if x is None else Finder._to_datetime64(x) for x in t_extent
             )
+            if (ext_start is not None and t_end < ext_start) or (
+                ext_end is not None and t_start > ext_end
+            ):
+                return True
+        s_extent = self.params_search.get("s_extent")
+        if s_extent:
+            # catalog extents are rounded to full degrees
+            minx, miny, maxx, maxy = s_extent
+            if minx > maxx:
+                # extent crossing the antimeridian, split into two boxes
+                extent_boxes = [
+                    box(minx - 1, miny - 1, 180, maxy + 1),
+                    box(-180, miny - 1, maxx + 1, maxy + 1),
+                ]
+            else:
+                extent_boxes = [box(minx - 1, miny - 1, maxx + 1, maxy + 1)]
+            aoi = self.params_search["aoi"]
+            if all(x.disjoint(aoi) for x in extent_boxes):
+                return True
+        return False
 
-        # make search
-        query = catalog.search(
-            collections=self.params_search["collection"],
-            datetime=[
-                np.datetime_as_string(self.params_search["t_start"], timezone="UTC"),
-                np.datetime_as_string(self.params_search["t_end"], timezone="UTC"),
-            ],
-            intersects=self.params_search["aoi"],
-        )
-        self.item_coll = query.item_collection()
+    @staticmethod
+    def _to_datetime64(value):
+        """
+        Converts a (timezone-aware) datetime to a naive UTC datetime64
+        """
+        ts = pd.Timestamp(value)
+        if ts.tz is not None:
+            ts = ts.tz_convert(None)
+        return ts.to_datetime64()
 
     def _postprocess_search(self, layer_key):
         """
@@ -150,59 +537,81 @@ class Finder:
         e.g. if bands are not organised as assets but as items
         """
         # collection-specific postprocessing
-        if (self.params_search["provider"] == "ASF") & (
-            self.params_search["collection"] == "sentinel-1-global-coherence"
-        ):
-            suffix = layer_key[-1].rsplit("_", 2)[1:]
-            if len(suffix) == 2:
-                var, pol = suffix
+        if self._is_asf_coherence():
+            product_type, polarizations = Finder._asf_coherence_filter(layer_key)
+            if polarizations:
                 item_coll = [
                     x
                     for x in self.item_coll
-                    if x.properties["sar:product_type"] == var.upper()
-                    and x.properties["sar:polarizations"] == [pol.upper()]
+                    if (props := x.properties)["sar:product_type"] == product_type
+                    and props["sar:polarizations"] == polarizations
                 ]
             else:
-                var = suffix[0]
                 item_coll = [
-                    x for x in self.item_coll if x.properties["sar:product_type"] == var
+                    x
+                    for x in self.item_coll
+                    if x.properties["sar:product_type"] == product_type
                 ]
             self.item_coll = item_coll
 
         # collection-indifferent postprocessing
-        with open(self.layout_file, "r") as f:
-            layout_json = json.load(f)
-            parsed_layout = Dataset._parse_layout(layout_json)
+        asset_name = _load_layout(self.layout_file)[tuple(layer_key)]["name"]
         for item in self.item_coll:
             # write layout key to assets extra field
-            asset_name = Dataset._lookup(parsed_layout, *layer_key)["name"]
             if asset_name in item.assets:
-                asset_dict = item.assets[asset_name].to_dict()
-                asset_dict["semantique:key"] = layer_key
-                modified_asset = pystac.Asset.from_dict(asset_dict)
-                item.assets[asset_name] = modified_asset
+                item.assets[asset_name].extra_fields["semantique:key"] = layer_key
             # subset item's assets to searched asset
             new_assets = {asset_name: item.assets[asset_name]}
             item.assets = new_assets
-            # set collection items datetimes if necessary
-            set_time = False
-            if self.params_search["temp"]:
-                if not item.properties.get("datetime"):
-                    set_time = True
-                    start_time = pd.Timestamp(item.properties["start_datetime"])
-                    end_time = pd.Timestamp(item.properties["end_datetime"])
-            else:
-                set_time = True
-                start_time = pd.Timestamp(self.t_start)
-                end_time = pd.Timestamp(self.t_end)
-            if set_time:
-                mean_time = start_time + (end_time - start_time) / 2
-                if mean_time.tz is None:
-                    mean_time = mean_time.tz_localize("UTC")
-                item.set_datetime(mean_time.to_pydatetime())
-                item.properties["datetime"] = mean_time.strftime(
-                    "%Y-%m-%dT%H:%M:%S.%fZ"
-                )
+
+        # set collection items datetimes if necessary
+        if self.params_search["temp"]:
+            items = [x for x in self.item_coll if not x.properties.get("datetime")]
+            start_times = pd.to_datetime(
+                [x.properties["start_datetime"] for x in items],
+                utc=True,
+                format="ISO8601",
+            )
+            end_times = pd.to_datetime(
+                [x.properties["end_datetime"] for x in items],
+                utc=True,
+                format="ISO8601",
+            )
+            mean_times = start_times + (end_times - start_times) / 2
+        else:
+            items = list(self.item_coll)
+            start_time = pd.Timestamp(self.t_start)
+            end_time = pd.Timestamp(self.t_end)
+            mean_time = start_time + (end_time - start_time) / 2
+            if mean_time.tz is None:
+                mean_time = mean_time.tz_localize("UTC")
+            mean_times = [mean_time] * len(items)
+        for item, mean_time in zip(items, mean_times):
+            item.set_datetime(mean_time.to_pydatetime())
+            item.properties["datetime"] = mean_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+        # sign the remaining assets in one go, i.e. only the searched asset
+        # per item and (via the token cache) one token per storage container
+        if self.params_search["provider"] == "Planet":
+            pc.sign_inplace(self.item_coll)
+
+    def _is_asf_coherence(self):
+        """Checks whether the ASF coherence dataset is searched"""
+        return (self.params_search["provider"] == "ASF") & (
+            self.params_search["collection"] == "sentinel-1-global-coherence"
+        )
+
+    @staticmethod
+    def _asf_coherence_filter(layer_key):
+        """
+        Derives the product type & polarizations to be searched for
+        from the layer key (e.g. "s1_coh12_vv" or "s1_inc")
+        """
+        suffix = layer_key[-1].rsplit("_", 2)[1:]
+        if len(suffix) == 2:
+            var, pol = suffix
+            return var.upper(), [pol.upper()]
+        return suffix[0], None
 
     def _merge_assets_per_item(self, item_collection):
         """
@@ -218,14 +627,18 @@ class Finder:
         merged_items = {}
         for item in item_collection.items:
             # combine item ID and collection ID to form a unique key
-            unique_key = f"{item.get_collection().id}::{item.id}"
+            # (collection_id avoids resolving the collection link)
+            unique_key = (item.collection_id, item.id)
             if unique_key in merged_items:
                 existing_item = merged_items[unique_key]
                 for asset_key, asset in item.assets.items():
                     if asset_key not in existing_item.assets:
                         existing_item.add_asset(asset_key, asset)
             else:
-                merged_items[unique_key] = item.clone()
+                # shallow copy suffices, only the assets are modified
+                merged_item = copy.copy(item)
+                merged_item.assets = dict(item.assets)
+                merged_items[unique_key] = merged_item
         # create a new item collection from the merged items
         new_items = list(merged_items.values())
         return pystac.ItemCollection(new_items)
@@ -3,6 +3,8 @@ import geopandas as gpd
 import numpy as np
 import os
 import pandas as pd
+import pickle
+import queue
 import rasterio as rio
 import rioxarray as rxr
 import shutil
@@ -12,11 +14,13 @@ import uuid
 import warnings
 import xarray as xr
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
 from enum import Enum
 from itertools import product
 from multiprocess import Pool
-from shapely.geometry import box
+from shapely.geometry import box, shape
+from shapely.strtree import STRtree
 from rioxarray.merge import merge_arrays
 from tqdm import tqdm
 
@@ -104,6 +108,10 @@ class TileHandler:
       caching : bool, tbd
       reauth : bool, tbd
       verbose : bool, tbd
+      n_workers : int, optional
+        Number of tiles processed concurrently by threads. Since tile
+        processing is mostly I/O-bound, this overlaps the data fetching of
+        multiple tiles. Note that the required RAM grows accordingly.
       **config :
         Additional configuration parameters forwarded to QueryRecipe.execute.
         See :class:`QueryRecipe`, respectively :class:`QueryProcessor`.
@@ -126,6 +134,7 @@ class TileHandler:
         caching=True,
         reauth=True,
         verbose=True,
+        n_workers=1,
         **config,
     ):
         # parse args
@@ -144,12 +153,18 @@ class TileHandler:
         self.caching = caching
         self.reauth = reauth
         self.verbose = verbose
+        self.n_workers = n_workers
         self.config = config
         # init additional args
         self.grid = None
         self.tile_results = []
         self.cache = None
+        self.cache_pickle = None
+        self.item_index = None
+        self.space_features = None
         self.stop_flag = False
+        self.write_queue = None
+        self.out_layer_dirs = set()
         # retrieve crs information
         if not self.crs:
             self.crs = self.space.crs
@@ -181,6 +196,14 @@ class TileHandler:
     def __del__(self):
         self._stop_signing_thread()
 
+    def _get_space_features(self):
+        """Returns the features of the spatial extent in the target crs,
+        reprojected only once.
+        """
+        if self.space_features is None:
+            self.space_features = self.space.features.to_crs(self.crs)
+        return self.space_features
+
     def _get_tile_dim(self):
         """Returns dimension usable for tiling & parallelisation of recipe execution.
         Calls `._get_op_dims()` to get dimensions which should be kept together to
@@ -240,46 +263,45 @@ class TileHandler:
                 self.crs,
                 precise=precise_shp,
                 verbose=self.verbose,
+                features=self._get_space_features(),
             )
+            # order tiles along a Hilbert curve, such that consecutive tiles
+            # are close to each other & likely reuse the same source data
+            self.grid = self._sort_spatial_grid(self.grid)
 
     def execute(self):
         """Runs the QueryProcessor.execute() method for all tiles."""
         # A) dry-run is performed to set up cache
         self.preview()
+        self._index_items()
 
         # B) eval recipe & postprocess in tile-wise manner
-        for i, tile in tqdm(
-            enumerate(self.grid),
-            disable=not self.verbose,
-            total=len(self.grid),
-            desc="executing recipe in tiled manner",
-        ):
-            # run workflow for single tile
-            context = self._create_context(
-                **{self.tile_dim: tile}, cache=deepcopy(self.cache)
-            )
-            response = self._execute_workflow(context)
-            # missing response possible in cases where
-            # self.tile_dim = sq.dimensions.TIME & trim=True
-            if response:
-                if not self.merge_mode:
-                    self.tile_results.append(response)
-                else:
-                    # postprocess response
-                    if self.tile_dim == sq.dimensions.TIME:
-                        response = self._postprocess_temporal(response)
-                    elif self.tile_dim == sq.dimensions.SPACE:
-                        response = self._postprocess_spatial(response)
-                    # write result (in-memory or to disk)
-                    if self.merge_mode == "merged":
-                        self.tile_results.append(response)
-                    else:
-                        for layer in response.keys():
-                            out_dir = os.path.join(self.out_dir, layer)
-                            out_path = os.path.join(out_dir, f"{i}.tif")
-                            os.makedirs(out_dir, exist_ok=True)
-                            response[layer].rio.to_raster(out_path)
-                            self.tile_results.append(out_path)
+        # tiles to be written to disk are handed over to a writer thread
+        if self.merge_mode and "vrt" in self.merge_mode:
+            self._start_writer_thread()
+        tile_results = {}
+        pool = ThreadPoolExecutor(max_workers=self.n_workers)
+        try:
+            futures = [
+                pool.submit(self._run_tile, i, tile) for i, tile in enumerate(self.grid)
+            ]
+            for future in tqdm(
+                as_completed(futures),
+                disable=not self.verbose,
+                total=len(futures),
+                desc="executing recipe in tiled manner",
+            ):
+                i, results = future.result()
+                tile_results[i] = results
+        finally:
+            # don't start remaining tiles if a tile failed
+            pool.shutdown(wait=True, cancel_futures=True)
+            write_errors = self._stop_writer_thread()
+        if write_errors:
+            raise write_errors[0]
+        # keep results in tile order
+        for i in sorted(tile_results):
+            self.tile_results.extend(tile_results[i])
 
         # C) optional merge of results
         if self.tile_results:
@@ -289,6 +311,93 @@ class TileHandler:
                 elif "vrt" in self.merge_mode:
                     self._merge_vrt()
 
+    def _run_tile(self, i, tile):
+        """Runs the workflow for a single tile & postprocesses its response.
+        Returns the tile index together with the tile's entries for
+        `self.tile_results`.
+        """
+        # skip tiles not covered by any of the datacube items
+        if not self._tile_has_items(tile):
+            return i, []
+        context = self._create_context(
+            **{self.tile_dim: tile}, cache=self._copy_cache()
+        )
+        response = self._execute_workflow(context)
+        # missing response possible in cases where
+        # self.tile_dim = sq.dimensions.TIME & trim=True
+        if not response:
+            return i, []
+        if not self.merge_mode:
+            return i, [response]
+        # postprocess response
+        if self.tile_dim == sq.dimensions.TIME:
+            response = self._postprocess_temporal(response)
+        elif self.tile_dim == sq.dimensions.SPACE:
+            response = self._postprocess_spatial(response)
+        # write result (in-memory or to disk)
+        if self.merge_mode == "merged":
+            return i, [response]
+        out_paths = []
+        for layer in response.keys():
+            out_dir = os.path.join(self.out_dir, layer)
+            out_path = os.path.join(out_dir, f"{i}.tif")
+            # create layer directories only once
+            if out_dir not in self.out_layer_dirs:
+                os.makedirs(out_dir, exist_ok=True)
+                self.out_layer_dirs.add(out_dir)
+            self.write_queue.put((response[layer], out_path))
+            out_paths.append(out_path)
+        return i, out_paths
+
+    def _index_items(self):
+        """Indexes the footprints (spatial tiling) or time spans (temporal tiling)
+        of the datacube items to recognise empty tiles without evaluating the
+        recipe for them. No index is created if footprints are incomplete.
+        """
+        self.item_index = None
+        if not isinstance(self.datacube, STACCube):
+            return
+        try:
+            items = list(self.datacube.src)
+            if not items:
+                return
+            if self.tile_dim == sq.dimensions.SPACE:
+                if any(x.geometry is None for x in items):
+                    return
+                self.item_index = STRtree([shape(x.geometry) for x in items])
+            elif self.tile_dim == sq.dimensions.TIME:
+                starts, ends = [], []
+                for item in items:
+                    props = item.properties
+                    start = props.get("start_datetime") or props.get("datetime")
+                    end = props.get("end_datetime") or props.get("datetime")
+                    if start is None or end is None:
+                        return
+                    starts.append(start)
+                    ends.append(end)
+                self.item_index = (
+                    pd.to_datetime(starts, utc=True, format="ISO8601"),
+                    pd.to_datetime(ends, utc=True, format="ISO8601"),
+                )
+        except Exception:
+            # unexpected item formats, don't skip any tiles
+            self.item_index = None
+
+    def _tile_has_items(self, tile):
+        """Checks if any of the indexed datacube items overlaps with the tile."""
+        if self.item_index is None:
+            return True
+        if self.tile_dim == sq.dimensions.SPACE:
+            # item footprints are given in WGS84
+            tile_bounds = tile.features.to_crs(4326).total_bounds
+            return len(self.item_index.query(box(*tile_bounds))) > 0
+        starts, ends = self.item_index
+        t_start, t_end = (
+            pd.Timestamp(x) if pd.Timestamp(x).tz else pd.Timestamp(x, tz="UTC")
+            for x in (tile["start"], tile["end"])
+        )
+        return bool(((starts <= t_end) & (ends >= t_start)).any())
+
     def _merge_single(self):
         """Merge results obtained for individual tiles by stitching them
         temporally or spatially depending on the tiling dimension.
@@ -378,6 +487,11 @@ class TileHandler:
         # run fake processor to initialise cache
         if self.caching:
             self.cache = fip.fap.cache
+        # snapshot of the cache from which per-tile copies are restored
+        try:
+            self.cache_pickle = pickle.dumps(self.cache, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            self.cache_pickle = None
 
         # preview run of workflow for a single tile
         # requires iteration over tiles until a valid response is obtained
@@ -397,7 +511,7 @@ class TileHandler:
                 break
             tile = self.grid[tile_idx]
             context = self._create_context(
-                **{self.tile_dim: tile}, preview=True, cache=deepcopy(self.cache)
+                **{self.tile_dim: tile}, preview=True, cache=self._copy_cache()
             )
             response = self._execute_workflow(context)
             valid_response = True if response else False
@@ -417,13 +531,17 @@ class TileHandler:
                 print(space_info, flush=True)
 
                 # retrieve amount of pixels for given spatial extent
-                total_bbox = self.space._features.to_crs(self.crs).total_bounds
+                total_bbox = self._get_space_features().total_bounds
                 width = total_bbox[2] - total_bbox[0]
                 height = total_bbox[3] - total_bbox[1]
                 num_pixels_x = int(np.ceil(width / abs(self.spatial_resolution[0])))
                 num_pixels_y = int(np.ceil(height / abs(self.spatial_resolution[1])))
                 xy_pixels = num_pixels_x * num_pixels_y
 
+                # relative size of vrt overviews (summed over all scales)
+                vrt_scales = np.array([4, 8, 16, 32, 64, 128, 256, 512])
+                vrt_factor = np.sum(1.0 / vrt_scales.astype(np.float64) ** 2)
+
                 # initialise dict to store layer information
                 lyrs_info = {}
                 for layer, arr in response.items():
@@ -451,13 +569,9 @@ class TileHandler:
                         self.chunksize_s,
                     )
                     # b) vrt
-                    vrt_scales = [4, 8, 16, 32, 64, 128, 256, 512]
                     size_tiles = lyr_info["merge"]["None"]["size"]
-                    size_vrt = sum(
-                        [
-                            arr.nbytes * xy_pixels / arr_xy.size / (1024**3) / (x**2)
-                            for x in vrt_scales
-                        ]
+                    size_vrt = float(
+                        arr.nbytes * xy_pixels / arr_xy.size / (1024**3) * vrt_factor
                     )
                     lyr_info["merge"]["vrt_*"] = {}
                     lyr_info["merge"]["vrt_*"]["n"] = len(self.grid)
@@ -544,15 +658,43 @@ class TileHandler:
                     print(line_l * "-", flush=True)
                     print("", flush=True)
 
-    def _continuous_signing(self):
-        """Calling resign function in a loop."""
-        while not self.signing_thread_event.is_set():
-            try:
-                self.datacube.src = STACCube._sign_metadata(list(self.datacube.src))
-                self.stop_flag = False
-            except Exception:
-                self.stop_flag = True
-            time.sleep(1)
+    def _continuous_signing(self, max_interval=60, min_interval=5):
+        """Calling resign function in a loop. Failed resigning is retried at
+        shorter intervals (halved down to `min_interval`), successful resigning
+        lets the interval grow back to `max_interval`.
+        """
+        interval = max_interval
+        try:
+            while not self.signing_thread_event.is_set():
+                try:
+                    self.datacube.src = STACCube._sign_metadata(
+                        list(self.datacube.src)
+                    )
+                    self._release_signing_waiters()
+                    interval = min(2 * interval, max_interval)
+                except Exception:
+                    with self.signing_condition:
+                        self.stop_flag = True
+                    interval = max(interval / 2, min_interval)
+                # sleep until the next resigning unless stopped before
+                self.signing_thread_event.wait(timeout=interval)
+        finally:
+            # never leave tiles waiting for a thread that no longer resigns
+            self._release_signing_waiters()
+
+    def _release_signing_waiters(self):
+        """Clear the resign error flag & wake up all tiles waiting for it."""
+        with self.signing_condition:
+            self.stop_flag = False
+            self.signing_condition.notify_all()
+
+    def _copy_cache(self):
+        """Returns a copy of the cache for a single tile. Restoring it from its
+        pickled snapshot is considerably faster than deep-copying it per tile.
+        """
+        if self.cache_pickle is not None:
+            return pickle.loads(self.cache_pickle)
+        return deepcopy(self.cache)
 
     def _create_context(self, **kwargs):
         """Create execution context with dynamic space/time."""
@@ -565,61 +707,62 @@ class TileHandler:
             "crs": self.crs,
             "spatial_resolution": self.spatial_resolution,
             **self.config,
+            **kwargs,
         }
-        context.update(kwargs)
         return context
 
     def _equalize_bands(self, src_paths):
         """Postprocesses the response to ensure avaliability of all bands"""
-        # get non-spatial dims (i.e. band dimension)
-        with rxr.open_rasterio(src_paths[0]) as src_arr:
-            band_dims = TileHandler._get_nonspatial_dims(src_arr)
-            band_dim = band_dims[0]
-            n_bands = len(src_arr[band_dim])
+        # get number of bands from the file header
+        with rio.open(src_paths[0]) as dst:
+            n_bands = dst.count
         # ensure same bands across arrays
         if n_bands > 1:
-            band_dim = band_dims[0]
-            # retrieve values for non-spatial dim
-            band_names = []
+            # retrieve values for non-spatial dim from the file headers
+            src_descriptions = {}
             for src in src_paths:
-                with rxr.open_rasterio(src) as src_arr:
-                    for band in src_arr.long_name:
-                        band_names.append(band)
-            band_names = list(np.unique(sorted(band_names)))
+                with rio.open(src) as dst:
+                    src_descriptions[src] = list(dst.descriptions)
+            band_names = sorted(set().union(*src_descriptions.values()))
             # introduce missing values for single arrays
             for src in src_paths:
+                # tiles with all bands in order can be kept as they are
+                if src_descriptions[src] == band_names:
+                    continue
                 with rxr.open_rasterio(src) as src_arr:
-                    # create list to hold any new bands that need to be created
-                    new_bands = []
-                    for band in band_names:
-                        if band not in src_arr.long_name:
-                            # create an array of NaNs with the same shape as one band of src_arr
-                            nan_band = np.full_like(
-                                src_arr.isel(**{band_dim: 0}), np.nan
-                            )
-                            nan_band = np.expand_dims(nan_band, 0)
-                            coords = {
-                                c: (c, src_arr.coords[c].values) for c in src_arr.dims
-                            }
-                            coords.update({band_dim: (band_dim, np.array([1]))})
-                            new_band = xr.DataArray(
-                                nan_band, dims=src_arr.dims, coords=coords, name=band
-                            )
-                            new_band.attrs["long_name"] = band
-                            new_bands.append(new_band)
-                    # combine original bands with new, previosuly missing bands
-                    if new_bands:
-                        dst_arr = xr.concat(new_bands + [src_arr], dim=band_dim)
-                        dst_arr.attrs["long_name"] = [
-                            *[x.long_name for x in new_bands],
-                            *src_arr.long_name,
-                        ]
-                    else:
-                        dst_arr = src_arr
-                    band_order = [dst_arr.long_name.index(x) for x in band_names]
-                    dst_arr = dst_arr.isel(**{band_dim: band_order})
-                    dst_arr.attrs["long_name"] = band_names
-                    dst_arr[band_dim] = np.arange(len(band_names)) + 1
+                    # get non-spatial dims (i.e. band dimension)
+                    band_dim = TileHandler._get_nonspatial_dims(src_arr)[0]
+                    src_names = src_arr.long_name
+                    if isinstance(src_names, str):
+                        src_names = [src_names]
+                    src_names = list(src_names)
+                    # fill bands into a single new array, NaN for missing bands
+                    # (each element is written exactly once)
+                    src_idxs = {band: i for i, band in enumerate(src_names)}
+                    dst_idxs = [i for i, b in enumerate(band_names) if b in src_idxs]
+                    missing_idxs = [
+                        i for i, b in enumerate(band_names) if b not in src_idxs
+                    ]
+                    dtype = np.result_type(src_arr.dtype, np.float32)
+                    values = np.empty(
+                        (len(band_names), *src_arr.shape[1:]), dtype=dtype
+                    )
+                    values[dst_idxs] = src_arr.values[
+                        [src_idxs[band_names[i]] for i in dst_idxs]
+                    ]
+                    values[missing_idxs] = np.nan
+                    coords = {
+                        k: v
+                        for k, v in src_arr.coords.items()
+                        if band_dim not in v.dims
+                    }
+                    coords[band_dim] = np.arange(len(band_names)) + 1
+                    dst_arr = xr.DataArray(
+                        values,
+                        dims=src_arr.dims,
+                        coords=coords,
+                        attrs={**src_arr.attrs, "long_name": band_names},
+                    )
                 # write updated array to disk
                 TileHandler._write_to_origin(dst_arr, src)
 
@@ -640,17 +783,21 @@ class TileHandler:
             retrieval_count += 1
             retrieval_error = False
             # check validity of datacube items (= Are items authenticated?)
-            on_hold_count = 0
-            while self.stop_flag:
-                time.sleep(1)
+            # wait to be notified by the signing thread about successful resigning
+            if self.stop_flag:
+                now = time.strftime(
+                    "%Y-%m-%d %H:%M:%S",
+                    time.localtime(time.time())
+                )
+                print(f"{now}: Execution paused due to resign error.", flush=True)
+                with self.signing_condition:
+                    # stop waiting if the signing thread ends in the meantime
+                    while self.stop_flag and self.signing_thread.is_alive():
+                        self.signing_condition.wait(timeout=5)
                 now = time.strftime(
                     "%Y-%m-%d %H:%M:%S",
                     time.localtime(time.time())
                 )
-                if not on_hold_count:
-                    print(f"{now}: Execution paused due to resign error.", flush=True)
-                on_hold_count += 1
-            if on_hold_count:
                 print(f"{now}: Execution continued after resign error.", flush=True)
             # run actual workflow
             with warnings.catch_warnings():
@@ -707,44 +854,36 @@ class TileHandler:
         # check if 3D input arrays
         if len(arr_dims):
             # possibly remaining dimension is the temporal one (e.g. year, season, etc)
-            # retrieve temporal values
             time_dim = arr_dims[0]
-            time_vals = [x[time_dim] for x in src_arrs]
-            time_vals = np.unique(xr.concat(time_vals, dim=time_dim).values)
+            # prepare source arrays once, keeping track of their temporal values
+            src_prep = []
+            for arr in src_arrs:
+                new_arr = arr.reset_coords(drop=True).rio.write_crs(crs)
+                new_arr = TileHandler._write_transform(new_arr, res)
+                src_prep.append((new_arr, set(arr[time_dim].values)))
+            time_vals = np.unique(
+                np.concatenate([x[time_dim].values for x in src_arrs])
+            )
             # for each timestep merge results spatially first
             arrs_main = []
             for time_val in time_vals:
-                arrs_sub = []
-                for arr in src_arrs:
-                    # slice array for given timestep
-                    try:
-                        arr_slice = arr.sel(**{time_dim: time_val})
-                    except KeyError:
-                        continue
-                    # introduce band coordinate as index variable
-                    new_arr = TileHandler._add_band_idx(arr_slice)
-                    new_arr = new_arr.rio.write_crs(crs)
-                    new_arr = TileHandler._write_transform(new_arr, res)
-                    arrs_sub.append(new_arr)
+                # slice arrays for given timestep, keeping it as band dimension
+                arrs_sub = [
+                    arr.sel(**{time_dim: [time_val]})
+                    .rename({time_dim: "band"})
+                    .transpose("band", ...)
+                    for arr, vals in src_prep
+                    if time_val in vals
+                ]
                 # spatial merge
                 merged_arr = merge_arrays(arrs_sub, crs=crs)
                 merged_arr = merged_arr[0].drop_vars("band")
                 # re-introducing time dimension
-                coords = {}
-                coords[time_dim] = ([time_dim], np.array([str(time_val)]))
-                coords.update(
-                    {dim: (dim, merged_arr[dim].values) for dim in merged_arr.dims}
-                )
-                new_arr = xr.DataArray(
-                    data=np.expand_dims(merged_arr.values, 0),
-                    coords=coords,
-                    attrs=merged_arr.attrs,
-                )
-                new_arr = new_arr.rio.write_crs(crs)
-                new_arr = TileHandler._write_transform(new_arr, res)
-                arrs_main.append(new_arr)
+                arrs_main.append(merged_arr.expand_dims({time_dim: [str(time_val)]}))
             # merge across time
             joint_arr = xr.concat(arrs_main, dim=time_dim)
+            joint_arr = joint_arr.rio.write_crs(crs)
+            joint_arr = TileHandler._write_transform(joint_arr, res)
             # persist band names
             joint_arr.attrs["long_name"] = [str(x) for x in joint_arr[time_dim].values]
             joint_arr.attrs["band_variable"] = time_dim
@@ -764,9 +903,14 @@ class TileHandler:
 
     def _merge_temporal(src_arrs):
         """Merges temporally stratified results into an array"""
+        # tiles share all coords but the temporal one, so these as well as
+        # the attrs are taken from the first tile without comparing them
+        concat_kwargs = dict(
+            coords="minimal", compat="override", combine_attrs="override"
+        )
         if isinstance(src_arrs[0], xr.core.dataarray.DataArray):
             # merge across time
-            dst_arr = xr.concat(src_arrs, dim=sq.dimensions.TIME)
+            dst_arr = xr.concat(src_arrs, dim=sq.dimensions.TIME, **concat_kwargs)
         elif isinstance(src_arrs[0], Collection):
             dst_arrs = []
             # merge collection results
@@ -776,7 +920,7 @@ class TileHandler:
                 arr = arr.assign_coords(grouper=grouper_vals)
                 dst_arrs.append(arr)
             # merge across time
-            dst_arr = xr.concat(dst_arrs, dim=sq.dimensions.TIME)
+            dst_arr = xr.concat(dst_arrs, dim=sq.dimensions.TIME, **concat_kwargs)
         else:
             raise NotImplementedError(f"No method for merging source array {src_arrs}.")
         return dst_arr
@@ -843,16 +987,49 @@ class TileHandler:
         """Start the signing thread."""
         if self.reauth:
             self.signing_thread_event = threading.Event()
+            self.signing_condition = threading.Condition()
             self.signing_thread = threading.Thread(target=self._continuous_signing)
             self.signing_thread.daemon = True
             self.signing_thread.start()
 
     def _stop_signing_thread(self):
         """Stop the signing thread."""
-        if hasattr(self, "signing_thread_event"):
+        if getattr(self, "signing_thread_event", None) is not None:
             self.signing_thread_event.set()
             self.signing_thread.join()
             self.signing_thread_event = None
+            self._release_signing_waiters()
+
+    def _start_writer_thread(self):
+        """Start the thread writing tile results to disk."""
+        # bounded queue to limit the amount of results held in memory
+        self.write_queue = queue.Queue(maxsize=4)
+        self.write_errors = []
+        self.writer_thread = threading.Thread(target=self._write_tiles)
+        self.writer_thread.daemon = True
+        self.writer_thread.start()
+
+    def _stop_writer_thread(self):
+        """Wait for pending writes, stop the writer thread & return write errors."""
+        if self.write_queue is None:
+            return []
+        self.write_queue.put(None)
+        self.writer_thread.join()
+        self.write_queue = None
+        return self.write_errors
+
+    def _write_tiles(self):
+        """Writing queued tile results to disk until receiving None."""
+        while True:
+            task = self.write_queue.get()
+            if task is None:
+                break
+            arr, out_path = task
+            try:
+                arr.rio.to_raster(out_path, **TileHandler._tile_profile(arr))
+            except Exception as e:
+                # keep draining the queue, errors are raised after execution
+                self.write_errors.append(e)
 
     @staticmethod
     def _add_band_idx(in_arr):
@@ -869,7 +1046,13 @@ class TileHandler:
 
     @staticmethod
     def _create_spatial_grid(
-        space, spatial_resolution, chunksize_s, crs, precise=True, verbose=True
+        space,
+        spatial_resolution,
+        chunksize_s,
+        crs,
+        precise=True,
+        verbose=True,
+        features=None,
     ):
         # create coarse spatial grid
         coarse_res = list(np.array(spatial_resolution) * chunksize_s)
@@ -894,7 +1077,11 @@ class TileHandler:
         ovlp_thres = 0.5 * pxl_area / tile_area
         # preprocess - create polygons for point & linestring features
         pxl_radius = np.sqrt(pxl_area / np.pi)
-        space = space.features.to_crs(extent.rio.crs)
+        # features may be given already reprojected (copied as modified below)
+        if features is not None:
+            space = features.copy()
+        else:
+            space = space.features.to_crs(extent.rio.crs)
         space.geometry = space.geometry.apply(
             lambda x: x.buffer(pxl_radius) if not x.area else x
         )
@@ -937,6 +1124,28 @@ class TileHandler:
                             spatial_grid.append(SpatialExtent(bbox_tile))
         return spatial_grid
 
+    @staticmethod
+    def _sort_spatial_grid(spatial_grid):
+        """Sorts the tiles of a spatial grid by the Hilbert distance of their centres."""
+        if len(spatial_grid) < 2:
+            return spatial_grid
+        bounds = np.array([tile.features.total_bounds for tile in spatial_grid])
+        centres = gpd.GeoSeries(
+            gpd.points_from_xy(
+                (bounds[:, 0] + bounds[:, 2]) / 2, (bounds[:, 1] + bounds[:, 3]) / 2
+            )
+        )
+        # tile bounds instead of centres ensure a non-degenerate total extent
+        total_bounds = (
+            bounds[:, 0].min(),
+            bounds[:, 1].min(),
+            bounds[:, 2].max(),
+            bounds[:, 3].max(),
+        )
+        distances = centres.hilbert_distance(total_bounds=total_bounds)
+        order = np.argsort(distances.values, kind="stable")
+        return [spatial_grid[i] for i in order]
+
     @staticmethod
     def _create_temporal_grid(t_start, t_end, chunksize_t):
         time_grid = pd.date_range(t_start, t_end, freq=chunksize_t)
@@ -1022,6 +1231,25 @@ class TileHandler:
             arr_dims.remove(sq.dimensions.Y)
         return arr_dims
 
+    @staticmethod
+    def _tile_profile(arr):
+        """
+        Creation options for writing tile results as internally tiled,
+        deflate-compressed GeoTIFFs, such that the windowed reads when
+        building virtual rasters only touch the relevant blocks
+        """
+        # horizontal differencing predictor (floating point for floats)
+        predictor = 3 if arr.dtype.kind == "f" else 2
+        return dict(
+            tiled=True,
+            blockxsize=512,
+            blockysize=512,
+            compress="deflate",
+            predictor=predictor,
+            num_threads="all_cpus",
+            BIGTIFF="IF_SAFER",
+        )
+
     @staticmethod
     def _write_to_origin(arr, path):
         """
@@ -1032,7 +1260,7 @@ class TileHandler:
         suffix = str(uuid.uuid4()).replace("-", "_")
         base, ext = os.path.splitext(path)
         temp_path = f"{base}_{suffix}_{ext}"
-        arr.rio.to_raster(temp_path)
+        arr.rio.to_raster(temp_path, **TileHandler._tile_profile(arr))
         shutil.move(temp_path, path)
 
     @staticmethod
@@ -1184,7 +1412,9 @@ class _PersistentWorker:
                             out_path = os.path.join(out_dir, f"{tile_idx}.tif")
                             os.makedirs(out_dir, exist_ok=True)
                             layer = response[layer].rio.write_crs(self.th.crs)
-                            layer.rio.to_raster(out_path)
+                            layer.rio.to_raster(
+                                out_path, **TileHandler._tile_profile(layer)
+                            )
                             out.append(out_path)
                         return out
         finally:
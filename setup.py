@@ -17,6 +17,7 @@ dependencies = [
     "stac-asset>=0.4.0",
     "stackstac @ git+https://github.com/fkroeber/stackstac.git",
     "tqdm",
+    "urllib3>=2.0",
 ]
 
 # List development dependencies.
@@ -41,7 +42,8 @@ setup(
     author_email="felix.kroeber@plus.ac.at",
     packages=find_packages(),
     package_data={
-        "gsemantique.data": ["*.pkl", "*.json"],
+        # the catalog cache only, not the layout.json.pkl sidecar
+        "gsemantique.data": ["data_cache.pkl", "*.json"],
     },
     python_requires=">=3.9",
     install_requires=dependencies,
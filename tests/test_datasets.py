@@ -0,0 +1,66 @@
+import pytest
+
+from gsemantique.data.datasets import Dataset, DatasetCatalog
+
+
+def _dataset(provider, collection, category, keys):
+    # extents are given, so nothing is fetched from the STAC endpoints
+    ds = Dataset(
+        provider=provider,
+        endpoint=f"https://{provider.lower()}.example.com/stac",
+        collection=collection,
+        temporality=None,
+        temporal_extent=[None, None],
+        spatial_extent=[-180, -90, 180, 90],
+        category=category,
+    )
+    ds.layout_keys = keys
+    return ds
+
+
+@pytest.fixture
+def catalog():
+    catalog = DatasetCatalog()
+    catalog.add(_dataset("Planet", "dem", "DEM", [("Planet", "dem", "height")]))
+    catalog.add(
+        _dataset(
+            "ASF",
+            "coherence",
+            "SAR",
+            [("ASF", "coherence", "vv"), ("ASF", "coherence", "vh")],
+        )
+    )
+    catalog.add(_dataset("Planet", "lulc", None, [("Planet", "lulc", "class")]))
+    return catalog
+
+
+def test_filter_idxs_single_value(catalog):
+    assert catalog._filter_idxs({"provider": "Planet"}) == [0, 2]
+
+
+def test_filter_idxs_list_of_values(catalog):
+    assert catalog._filter_idxs({"category": ["DEM", "SAR"]}) == [0, 1]
+
+
+def test_filter_idxs_none_value(catalog):
+    assert catalog._filter_idxs({"category": None}) == [2]
+
+
+def test_filter_idxs_multiple_criteria(catalog):
+    assert catalog._filter_idxs({"provider": "Planet", "category": "DEM"}) == [0]
+    assert catalog._filter_idxs({"provider": "ASF", "category": "DEM"}) == []
+
+
+def test_filter_idxs_n_bands(catalog):
+    assert catalog._filter_idxs({"n_bands": 2}) == [1]
+
+
+def test_filter_datasets(catalog):
+    datasets = catalog.filter_datasets(provider="ASF")
+    assert [ds.collection for ds in datasets] == ["coherence"]
+
+
+def test_filter_table_keeps_catalog_index(catalog):
+    table = catalog.filter(provider="Planet")
+    assert list(table.index) == [0, 2]
+    assert list(table["collection"]) == ["dem", "lulc"]
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from types import SimpleNamespace
+
+gpd = pytest.importorskip("geopandas")
+pytest.importorskip("semantique")
+pytest.importorskip("rioxarray")
+
+from shapely.geometry import box  # noqa: E402
+
+from gsemantique.process.scaling import TileHandler  # noqa: E402
+
+
+def _tile(x, y, size=10):
+    # minimal stand-in for a SpatialExtent, only its features are used
+    features = gpd.GeoDataFrame(geometry=[box(x, y, x + size, y + size)])
+    return SimpleNamespace(features=features, origin=(x, y))
+
+
+def test_sort_spatial_grid_is_permutation():
+    grid = [_tile(x, y) for x in range(0, 40, 10) for y in range(0, 40, 10)]
+    sorted_grid = TileHandler._sort_spatial_grid(grid)
+    assert len(sorted_grid) == len(grid)
+    assert {id(x) for x in sorted_grid} == {id(x) for x in grid}
+
+
+def test_sort_spatial_grid_neighbouring_tiles():
+    # grid as created column-wise by `_create_spatial_grid`
+    grid = [_tile(x, y) for x in range(0, 40, 10) for y in range(0, 40, 10)]
+    sorted_grid = TileHandler._sort_spatial_grid(grid)
+    # along a Hilbert curve consecutive tiles of a 4x4 grid share an edge
+    for prev, curr in zip(sorted_grid, sorted_grid[1:]):
+        dx = abs(prev.origin[0] - curr.origin[0])
+        dy = abs(prev.origin[1] - curr.origin[1])
+        assert dx + dy == 10
+
+
+def test_sort_spatial_grid_single_row():
+    # degenerate extent of tile centres (all on one line)
+    grid = [_tile(x, 0) for x in range(30, -10, -10)]
+    sorted_grid = TileHandler._sort_spatial_grid(grid)
+    assert sorted(x.origin[0] for x in sorted_grid) == [0, 10, 20, 30]
+
+
+def test_sort_spatial_grid_single_tile():
+    grid = [_tile(0, 0)]
+    assert TileHandler._sort_spatial_grid(grid) == grid
+
+
+def _writer_handler():
+    # handler without recipe setup, only the writer thread is used
+    handler = TileHandler.__new__(TileHandler)
+    handler.write_queue = None
+    return handler
+
+
+def _array(to_raster):
+    # minimal stand-in for a tile result written via rioxarray
+    return SimpleNamespace(
+        dtype=np.dtype("float32"), rio=SimpleNamespace(to_raster=to_raster)
+    )
+
+
+def test_writer_thread_writes_all_tiles():
+    written = []
+    handler = _writer_handler()
+    handler._start_writer_thread()
+    for i in range(10):
+        arr = _array(lambda path, **kwargs: written.append((path, kwargs)))
+        handler.write_queue.put((arr, f"tile_{i}.tif"))
+    assert handler._stop_writer_thread() == []
+    assert [x[0] for x in written] == [f"tile_{i}.tif" for i in range(10)]
+    assert written[0][1]["predictor"] == 3
+    assert handler.write_queue is None
+
+
+def test_writer_thread_collects_errors():
+    written = []
+
+    def fail(path, **kwargs):
+        raise OSError(path)
+
+    handler = _writer_handler()
+    handler._start_writer_thread()
+    handler.write_queue.put((_array(fail), "tile_0.tif"))
+    handler.write_queue.put(
+        (_array(lambda path, **kwargs: written.append(path)), "tile_1.tif")
+    )
+    errors = handler._stop_writer_thread()
+    # failed writes don't stop the remaining ones
+    assert written == ["tile_1.tif"]
+    assert len(errors) == 1
+    assert isinstance(errors[0], OSError)
+
+
+def test_stop_writer_thread_not_started():
+    assert _writer_handler()._stop_writer_thread() == []
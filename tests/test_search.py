@@ -0,0 +1,324 @@
+import json
+import numpy as np
+import pytest
+
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+pytest.importorskip("semantique")
+pystac = pytest.importorskip("pystac")
+shapely_geometry = pytest.importorskip("shapely.geometry")
+
+from gsemantique.data import search  # noqa: E402
+from gsemantique.data.datasets import Dataset, DatasetCatalog  # noqa: E402
+from gsemantique.data.search import Finder  # noqa: E402
+
+TESTS_DIR = Path(__file__).parent
+LNDST = ("Planet", "reflectance")
+
+
+def _load_json(path):
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+@pytest.fixture
+def mapping():
+    return _load_json(TESTS_DIR / "mapping.json")
+
+
+@pytest.mark.parametrize(
+    "recipe_name, expected",
+    [
+        ("01_treduce.json", {(*LNDST, "lndst_qa")}),
+        ("05_tgrouped.json", {(*LNDST, "lndst_qa")}),
+        (
+            "08_tmulti_double_strat.json",
+            {
+                (*LNDST, x)
+                for x in ["lndst_qa", "lndst_red", "lndst_green", "lndst_blue"]
+            },
+        ),
+        ("09_udf.json", {(*LNDST, "lndst_qa")}),
+    ],
+)
+def test_extract_layer_refs(mapping, recipe_name, expected):
+    recipe = _load_json(TESTS_DIR / "recipes" / recipe_name)
+    assert set(search._extract_layer_refs(recipe, mapping)) == expected
+
+
+def test_extract_layer_refs_all_recipes_resolvable(mapping):
+    for recipe_file in (TESTS_DIR / "recipes").glob("*.json"):
+        layer_keys = search._extract_layer_refs(_load_json(recipe_file), mapping)
+        assert layer_keys
+        assert all(isinstance(x, tuple) for x in layer_keys)
+
+
+def test_extract_layer_refs_unknown_concept(mapping):
+    recipe = {"res": {"type": "concept", "reference": ["entity", "unknown"]}}
+    with pytest.raises(search._UnresolvableReference):
+        search._extract_layer_refs(recipe, mapping)
+
+
+def test_extract_layer_refs_nested_concepts():
+    mapping = {
+        "entity": {
+            "water": {"color": {"type": "concept", "reference": ["entity", "blue"]}},
+            "blue": {"color": {"type": "layer", "reference": ["P", "r", "blue"]}},
+        }
+    }
+    recipe = {"res": {"type": "concept", "reference": ["entity", "water"]}}
+    assert search._extract_layer_refs(recipe, mapping) == (("P", "r", "blue"),)
+
+
+def test_extract_layer_refs_concept_property():
+    mapping = {
+        "entity": {
+            "water": {
+                "color": {"type": "layer", "reference": ["A", "b"]},
+                "texture": {"type": "layer", "reference": ["B", "c"]},
+            }
+        }
+    }
+    concept = {"type": "concept", "reference": ["entity", "water"]}
+    recipe = {"res": {**concept, "property": "color"}}
+    assert search._extract_layer_refs(recipe, mapping) == (("A", "b"),)
+    recipe = {"res": concept}
+    assert search._extract_layer_refs(recipe, mapping) == (("A", "b"), ("B", "c"))
+    recipe = {"res": {**concept, "property": "unknown"}}
+    with pytest.raises(search._UnresolvableReference):
+        search._extract_layer_refs(recipe, mapping)
+
+
+def test_extract_layer_refs_order():
+    mapping = {
+        "entity": {"water": {"color": {"type": "layer", "reference": ["A", "b"]}}}
+    }
+    recipe = {
+        "x": {"type": "layer", "reference": ["B", "c"]},
+        "y": {"type": "concept", "reference": ["entity", "water"]},
+        "z": [
+            {"type": "layer", "reference": ["C", "d"]},
+            {"type": "layer", "reference": ["B", "c"]},
+        ],
+    }
+    # de-duplicated, in the order of the first reference
+    assert search._extract_layer_refs(recipe, mapping) == (
+        ("B", "c"),
+        ("A", "b"),
+        ("C", "d"),
+    )
+
+
+@pytest.fixture
+def layer_refs_cache(monkeypatch):
+    monkeypatch.setattr(search, "_LAYER_REFS_CACHE", search.OrderedDict())
+    return search._LAYER_REFS_CACHE
+
+
+def test_layer_refs_cache_lru(layer_refs_cache, monkeypatch):
+    monkeypatch.setattr(search, "LAYER_REFS_CACHE_SIZE", 2)
+    for key in ["a", "b"]:
+        search._cache_layer_refs(key, ((key,),))
+    # using "a" makes "b" the least recently used entry
+    assert search._get_cached_layer_refs("a") == (("a",),)
+    search._cache_layer_refs("c", (("c",),))
+    assert list(layer_refs_cache) == ["a", "c"]
+    assert search._get_cached_layer_refs("b") is None
+
+
+def _dataset(provider, collection, keys, spatial_extent=(-180, -90, 180, 90)):
+    ds = Dataset(
+        provider=provider,
+        endpoint=f"https://{provider.lower()}.example.com/stac",
+        collection=collection,
+        temporality="1D",
+        temporal_extent=[datetime(2015, 1, 1, tzinfo=timezone.utc), None],
+        spatial_extent=list(spatial_extent),
+    )
+    ds.layout_keys = keys
+    return ds
+
+
+@pytest.fixture
+def finder():
+    catalog = DatasetCatalog()
+    catalog.add(
+        _dataset("Planet", "landsat", [(*LNDST, "lndst_red"), (*LNDST, "lndst_qa")])
+    )
+    catalog.add(
+        _dataset(
+            "ASF",
+            "sentinel-1-global-coherence",
+            [
+                ("ASF", "coherence", "s1_coh12_vv"),
+                ("ASF", "coherence", "s1_coh12_hh"),
+                ("ASF", "coherence", "s1_coh6_vv"),
+            ],
+        )
+    )
+    aoi = shapely_geometry.box(10, 50, 11, 51)
+    return Finder(catalog, "2020-01-01", "2020-02-01", aoi)
+
+
+@pytest.mark.parametrize("as_geojson", [dict, json.dumps])
+def test_finder_geojson_aoi(finder, as_geojson):
+    aoi = shapely_geometry.box(10, 50, 11, 51)
+    geojson = as_geojson(shapely_geometry.mapping(aoi))
+    geojson_finder = Finder(finder.ds_catalog, "2020-01-01", "2020-02-01", geojson)
+    assert geojson_finder.aoi.equals(aoi)
+
+
+def test_search_signature_groups_layers(finder):
+    sig = finder._search_signature
+    assert sig((*LNDST, "lndst_red")) == sig((*LNDST, "lndst_qa"))
+    assert sig(("ASF", "coherence", "s1_coh12_vv")) == sig(
+        ("ASF", "coherence", "s1_coh12_hh")
+    )
+    assert sig(("ASF", "coherence", "s1_coh12_vv")) != sig(
+        ("ASF", "coherence", "s1_coh6_vv")
+    )
+    assert sig((*LNDST, "lndst_red")) != sig(("ASF", "coherence", "s1_coh12_vv"))
+
+
+def test_outside_extent(finder):
+    finder._retrieve_params((*LNDST, "lndst_red"))
+    assert not finder._outside_extent()
+    # time window before the temporal extent
+    finder.params_search["t_start"] = np.datetime64("2010-01-01")
+    finder.params_search["t_end"] = np.datetime64("2011-01-01")
+    assert finder._outside_extent()
+    # inverted time window
+    finder.params_search["t_start"] = np.datetime64("2021-01-01")
+    finder.params_search["t_end"] = np.datetime64("2020-01-01")
+    assert finder._outside_extent()
+
+
+def test_outside_extent_spatial(finder):
+    finder._retrieve_params((*LNDST, "lndst_red"))
+    finder.params_search["s_extent"] = [-10, -10, 0, 0]
+    assert finder._outside_extent()
+    # antimeridian-crossing extent
+    finder.params_search["s_extent"] = [170, -20, -170, 20]
+    finder.params_search["aoi"] = shapely_geometry.box(175, 0, 176, 1)
+    assert not finder._outside_extent()
+    finder.params_search["aoi"] = shapely_geometry.box(-175, 0, -174, 1)
+    assert not finder._outside_extent()
+    finder.params_search["aoi"] = shapely_geometry.box(0, 0, 1, 1)
+    assert finder._outside_extent()
+
+
+def test_outside_extent_geojson_aoi(finder):
+    aoi = shapely_geometry.mapping(shapely_geometry.box(175, 0, 176, 1))
+    geojson_finder = Finder(finder.ds_catalog, "2020-01-01", "2020-02-01", aoi)
+    geojson_finder._retrieve_params((*LNDST, "lndst_red"))
+    assert not geojson_finder._outside_extent()
+    geojson_finder.params_search["s_extent"] = [-10, -10, 0, 0]
+    assert geojson_finder._outside_extent()
+
+
+@pytest.fixture
+def search_cache(monkeypatch):
+    monkeypatch.setattr(search, "_SEARCH_CACHE", search.OrderedDict())
+    return search._SEARCH_CACHE
+
+
+def test_search_cache_ttl(search_cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(search.time, "time", lambda: now[0])
+    search._cache_search("key", pystac.ItemCollection([]))
+    assert search._get_cached_search("key") is not None
+    now[0] += search.SEARCH_CACHE_TTL
+    assert search._get_cached_search("key") is None
+    assert "key" not in search_cache
+
+
+def test_search_cache_lru(search_cache, monkeypatch):
+    monkeypatch.setattr(search, "SEARCH_CACHE_SIZE", 2)
+    for key in ["a", "b"]:
+        search._cache_search(key, pystac.ItemCollection([]))
+    # using "a" makes "b" the least recently used entry
+    assert search._get_cached_search("a") is not None
+    search._cache_search("c", pystac.ItemCollection([]))
+    assert list(search_cache) == ["a", "c"]
+
+
+def test_search_cache_returns_copies(search_cache):
+    search._cache_search("key", pystac.ItemCollection([]))
+    first = search._get_cached_search("key")
+    assert first is not search._get_cached_search("key")
+
+
+def test_clear_search_cache(search_cache):
+    search._cache_search("key", pystac.ItemCollection([]))
+    Finder.clear_search_cache()
+    assert search._get_cached_search("key") is None
+
+
+class _FakeClient:
+    # counts the searches made, each returning no items
+    def __init__(self):
+        self.n_searches = 0
+
+    def search(self, **kwargs):
+        self.n_searches += 1
+        return SimpleNamespace(item_collection=lambda: pystac.ItemCollection([]))
+
+
+def test_retrieve_metadata_refresh(finder, search_cache, monkeypatch):
+    client = _FakeClient()
+    monkeypatch.setattr(search, "_get_client", lambda endpoint: client)
+    layer_key = (*LNDST, "lndst_red")
+    finder._retrieve_params(layer_key)
+    finder._retrieve_metadata(layer_key)
+    finder._retrieve_metadata(layer_key)
+    assert client.n_searches == 1
+    finder._retrieve_metadata(layer_key, refresh=True)
+    assert client.n_searches == 2
+    # refreshed results replace the cached ones
+    finder._retrieve_metadata(layer_key)
+    assert client.n_searches == 2
+
+
+@pytest.mark.parametrize(
+    "layer_name, expected",
+    [
+        ("s1_coh12_vv", ("COH12", ["VV"])),
+        ("s1_coh6_hh", ("COH6", ["HH"])),
+    ],
+)
+def test_asf_coherence_filter(layer_name, expected):
+    layer_key = ("ASF", "coherence", layer_name)
+    assert Finder._asf_coherence_filter(layer_key) == expected
+
+
+def _asf_item(item_id, product_type, polarizations):
+    item = pystac.Item(
+        id=item_id,
+        geometry=None,
+        bbox=None,
+        datetime=datetime(2020, 1, 10, tzinfo=timezone.utc),
+        properties={
+            "sar:product_type": product_type,
+            "sar:polarizations": polarizations,
+        },
+    )
+    item.add_asset("data", pystac.Asset(f"https://example.com/{item_id}.tif"))
+    return item
+
+
+def test_postprocess_search_asf_coherence(finder):
+    layer_key = ("ASF", "coherence", "s1_coh12_vv")
+    finder._retrieve_params(layer_key)
+    finder.item_coll = pystac.ItemCollection(
+        [
+            _asf_item("a", "COH12", ["VV"]),
+            _asf_item("b", "COH12", ["HH"]),
+            _asf_item("c", "COH06", ["VV"]),
+        ]
+    )
+    finder._postprocess_search(layer_key)
+    assert [x.id for x in finder.item_coll] == ["a"]
+    asset = finder.item_coll[0].assets["data"]
+    assert asset.extra_fields["semantique:key"] == layer_key